@@ -4,6 +4,8 @@ from wtforms.datalist import DataList
 from wtforms.datalist import DataListChoice
 from wtforms.datalist import enum_datalist
 from wtforms.fields.choices import Choice
+from wtforms.fields.choices import ChoiceCatalog
+from wtforms.fields.choices import ChoicesProvider
 from wtforms.fields.choices import RadioField
 from wtforms.fields.choices import SelectChoice
 from wtforms.fields.choices import SelectField
@@ -40,6 +42,7 @@ from wtforms.fields.simple import TelField
 from wtforms.fields.simple import TextAreaField
 from wtforms.fields.simple import URLField
 from wtforms.form import Form
+from wtforms.form import FormPool
 from wtforms.validators import ValidationError
 
 __version__ = "3.3.0b3"
@@ -48,6 +51,7 @@ __all__ = [
     "validators",
     "widgets",
     "Form",
+    "FormPool",
     "ValidationError",
     "SelectField",
     "SelectMultipleField",
@@ -85,6 +89,8 @@ __all__ = [
     "EmailField",
     "ColorField",
     "Choice",
+    "ChoiceCatalog",
+    "ChoicesProvider",
     "SelectChoice",
     "DataListChoice",
     "enum_datalist",
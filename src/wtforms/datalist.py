@@ -10,7 +10,7 @@ from wtforms.fields.choices import Choice
 __all__ = ("DataList", "DataListChoice", "enum_datalist")
 
 
-@dataclass
+@dataclass(slots=True)
 class DataListChoice:
     """
     An option declared via :class:`~wtforms.DataList`'s ``choices=``
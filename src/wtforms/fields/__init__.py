@@ -1,4 +1,6 @@
 from wtforms.fields.choices import Choice
+from wtforms.fields.choices import ChoiceCatalog
+from wtforms.fields.choices import ChoicesProvider
 from wtforms.fields.choices import enum_choices
 from wtforms.fields.choices import enum_coerce
 from wtforms.fields.choices import RadioField
@@ -43,6 +45,8 @@ __all__ = [
     "Flags",
     "Label",
     "Choice",
+    "ChoiceCatalog",
+    "ChoicesProvider",
     "SelectChoice",
     "SelectField",
     "SelectMultipleField",
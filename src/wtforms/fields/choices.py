@@ -1,17 +1,23 @@
+import itertools
 import warnings
 from dataclasses import dataclass
 from dataclasses import field
 from dataclasses import replace
 from itertools import groupby
-from operator import attrgetter
 from typing import NamedTuple
 
+from markupsafe import escape
+
 from wtforms import widgets
 from wtforms._compat import get_signature
 from wtforms.fields.core import Field
+from wtforms.fields.core import Flags
+from wtforms.fields.core import Label
 from wtforms.validators import ValidationError
 
 __all__ = (
+    "ChoiceCatalog",
+    "ChoicesProvider",
     "SelectField",
     "Choice",
     "SelectChoice",
@@ -48,7 +54,7 @@ class Choice(NamedTuple):
     render_kw: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectChoice:
     """
     An option declared via :class:`SelectField` and
@@ -200,6 +206,274 @@ def _normalize_iter_choice(choice):
     )
 
 
+def _normalize_choices(choices):
+    """Parse ``choices`` into a list of :class:`SelectChoice`."""
+    if choices is None:
+        return None
+
+    if isinstance(choices, dict):
+        if SelectFieldBase._is_shorthand_dict(choices):
+            result = []
+            for key, value in choices.items():
+                if isinstance(value, dict):
+                    for inner_value, inner_label in value.items():
+                        result.append(
+                            SelectChoice(
+                                value=inner_value, label=inner_label, optgroup=key
+                            )
+                        )
+                else:
+                    result.append(SelectChoice(value=key, label=value))
+            return result
+        return [
+            SelectChoice.from_input(input, optgroup)
+            for optgroup, inputs in choices.items()
+            for input in inputs
+        ]
+
+    return [SelectChoice.from_input(input) for input in choices]
+
+
+def _choices_snapshot(source, deep):
+    """Return a copy of the contents of a list or dict of choices, to tell
+    whether they were changed in place, or `None` for other choices.
+
+    If ``deep``, choices are copied down to the attributes of the mutable
+    objects they hold, such as :class:`SelectChoice` or groups; otherwise
+    they are copied shallowly, which is much cheaper to compare."""
+    if isinstance(source, list):
+        items = source.copy()
+    elif isinstance(source, dict):
+        items = list(source.items())
+    else:
+        return None
+    if deep:
+        return [_choice_state(item) for item in items]
+    return items
+
+
+def _choice_state(item):
+    """Return the contents of a choice or group of choices, recursively."""
+    if type(item) is SelectChoice:
+        return item.value, item.label, item.optgroup, _render_kw_state(item)
+    if isinstance(item, (list, tuple)):
+        return type(item), [_choice_state(i) for i in item]
+    if isinstance(item, dict):
+        return dict, [(key, _choice_state(value)) for key, value in item.items()]
+    if isinstance(item, SelectChoice):
+        return type(item), item.value, item.label, item.optgroup, _render_kw_state(item)
+    return item
+
+
+def _render_kw_state(choice):
+    render_kw = choice.render_kw
+    return render_kw.copy() if render_kw else None
+
+
+_MUTABLE_CHOICE_TYPES = (SelectChoice, list, dict)
+
+
+def _holds_mutable_choices(item):
+    if isinstance(item, tuple):
+        return any(isinstance(i, _MUTABLE_CHOICE_TYPES) for i in item)
+    return isinstance(item, _MUTABLE_CHOICE_TYPES)
+
+
+class _ChoiceIndex:
+    """
+    The choices of a field normalized into :class:`SelectChoice`, along with
+    their coerced values and a map from each coerced value to the positions
+    of the choices having it.
+
+    Coercion is done on first use, as fields only needing to know about
+    groups never coerce their choices.
+    """
+
+    __slots__ = (
+        "source",
+        "deep",
+        "snapshot",
+        "coerce",
+        "choices",
+        "has_groups",
+        "escaped_labels",
+        "option_html",
+        "_coerced",
+    )
+
+    def __init__(self, source, choices, coerce, escaped_labels=None):
+        self.source = source
+        # Plain values are only changed by replacing them, which a shallow
+        # copy tells, so only copy the contents of mutable choices.
+        self.deep = isinstance(source, (list, dict)) and any(
+            _holds_mutable_choices(item)
+            for item in (source.items() if isinstance(source, dict) else source)
+        )
+        self.snapshot = _choices_snapshot(source, self.deep)
+        self.coerce = coerce
+        self.choices = choices
+        self.has_groups = any(c.optgroup is not None for c in choices)
+        self.escaped_labels = escaped_labels
+        # The unselected ``<option>`` of each choice, set by the
+        # :class:`~wtforms.widgets.Select` widget on first render.
+        self.option_html = None
+        self._coerced = None
+
+    def is_current(self, source, coerce):
+        """Whether this index still describes ``source`` as coerced by
+        ``coerce``. A list or dict reassigned or changed in place needs a
+        new index."""
+        return (
+            self.source is source
+            and self.coerce is coerce
+            and self.snapshot == _choices_snapshot(source, self.deep)
+        )
+
+    def _coerced_values(self):
+        if self._coerced is None:
+            coerced = tuple(self.coerce(c.value) for c in self.choices)
+            positions = {}
+            try:
+                for position, value in enumerate(coerced):
+                    positions.setdefault(value, []).append(position)
+            except TypeError:
+                positions = None
+            self._coerced = coerced, positions
+        return self._coerced
+
+    def positions_of(self, data):
+        """Return the positions of the choices whose coerced value equals
+        ``data``."""
+        coerced, positions = self._coerced_values()
+        if positions is not None:
+            try:
+                return positions.get(data, ())
+            except TypeError:
+                pass
+        return [position for position, value in enumerate(coerced) if value == data]
+
+    def selected(self, data):
+        """Return the set of positions of the choices selected by ``data``,
+        a list of values."""
+        return {position for d in data for position in self.positions_of(d)}
+
+
+class ChoiceCatalog:
+    """
+    An immutable set of choices, normalized and indexed once, which can be
+    passed as ``choices=`` to any number of :class:`SelectField`,
+    :class:`SelectMultipleField` and :class:`RadioField`.
+
+    Fields using a catalog with the same ``coerce`` function share its
+    normalized choices and its index of coerced values, instead of building
+    their own for each form instance. A field with another ``coerce``
+    function still reuses the normalized choices.
+
+    Build catalogs at import time: as nothing is computed lazily, forked
+    worker processes only ever read the catalogs built by their parent.
+    The catalog keeps its own copies of the :class:`SelectChoice` objects
+    it is given, which must not be changed.
+
+    :param choices:
+        Any list or dict accepted as ``choices=`` by :class:`SelectField`.
+    :param coerce:
+        The function coercing the choice values, as for
+        :class:`SelectField`.
+    """
+
+    __slots__ = ("choices", "coerce", "escaped_labels", "_index")
+
+    def __init__(self, choices, coerce=str):
+        if callable(choices):
+            raise TypeError("ChoiceCatalog choices cannot be a callable.")
+        SelectFieldBase._warn_legacy_choices(choices)
+        # Copy the choices, whose options are rendered once below, so that
+        # editing the objects passed in does not make that HTML stale.
+        normalized = tuple(
+            replace(c, render_kw=dict(c.render_kw or {}))
+            for c in _normalize_choices(choices)
+        )
+        escaped_labels = tuple(escape(c.label or c.value) for c in normalized)
+        index = _ChoiceIndex(self, normalized, coerce, escaped_labels)
+        index._coerced_values()
+        index.option_html = widgets.Select._render_unselected_options(
+            normalized, escaped_labels
+        )
+        object.__setattr__(self, "choices", normalized)
+        object.__setattr__(self, "coerce", coerce)
+        object.__setattr__(self, "escaped_labels", escaped_labels)
+        object.__setattr__(self, "_index", index)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __iter__(self):
+        return iter(self.choices)
+
+    def __len__(self):
+        return len(self.choices)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} of {len(self.choices)} choices>"
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return type(self), (list(self.choices), self.coerce)
+
+    @property
+    def has_groups(self):
+        """Whether any choice has an ``optgroup``."""
+        return self._index.has_groups
+
+    def __contains__(self, data):
+        """Whether ``data`` is the coerced value of one of the choices."""
+        return bool(self._index.positions_of(data))
+
+
+class ChoicesProvider:
+    """
+    Base class for choices too many to be held in memory, such as rows of
+    a large table, which can be passed as ``choices=`` to
+    :class:`SelectField`, :class:`SelectMultipleField` and
+    :class:`RadioField`.
+
+    Validation asks the provider whether each submitted value is one of its
+    choices. Rendering only lists the first :attr:`render_limit` choices,
+    along with the selected ones, which suits widgets completing the list
+    on the client side.
+
+    Values given to :meth:`contains` and :meth:`label_for` are the field's
+    data, already coerced by its ``coerce`` function.
+    """
+
+    #: The number of choices rendered, not counting the selected ones not
+    #: among them. ``None`` renders every choice.
+    render_limit = 100
+
+    def contains(self, value):
+        """Whether ``value`` is one of the choices."""
+        raise NotImplementedError()
+
+    def label_for(self, value):
+        """Return the label of the choice for ``value``, or `None` if
+        ``value`` is not one of the choices."""
+        raise NotImplementedError()
+
+    def iter_window(self, start=0, stop=None):
+        """Yield the choices from position ``start`` up to ``stop``, or the
+        last one if ``stop`` is `None`, as :class:`SelectChoice` or any
+        other choice accepted in a list of ``choices``."""
+        raise NotImplementedError()
+
+
 class SelectFieldBase(Field):
     option_widget = widgets.Option()
 
@@ -242,6 +516,19 @@ class SelectFieldBase(Field):
             yield name, [_normalize_iter_choice(c) for c in group]
 
     def __iter__(self):
+        if issubclass(self._Option, Field):
+            # An option class still based on Field, bound for each choice.
+            yield from self._iter_option_fields()
+            return
+
+        flags = Flags()
+        for v in itertools.chain(self.validators, [self.option_widget]):
+            for k, value in getattr(v, "field_flags", {}).items():
+                setattr(flags, k, value)
+        for i, choice in enumerate(self._iter_choices_normalized()):
+            yield self._Option(self, f"{self.id}-{i}", choice, flags)
+
+    def _iter_option_fields(self):
         opts = dict(
             widget=self.option_widget,
             validators=self.validators,
@@ -263,33 +550,13 @@ class SelectFieldBase(Field):
 
     def _choices_from_input(self, choices):
         """Parse the user-supplied ``choices`` into a list of :class:`SelectChoice`."""
+        if isinstance(choices, ChoiceCatalog):
+            return list(choices.choices)
+
         if callable(choices):
             choices = self._invoke_choices_callback(choices)
 
-        if choices is None:
-            return None
-
-        if isinstance(choices, dict):
-            if self._is_shorthand_dict(choices):
-                result = []
-                for key, value in choices.items():
-                    if isinstance(value, dict):
-                        for inner_value, inner_label in value.items():
-                            result.append(
-                                SelectChoice(
-                                    value=inner_value, label=inner_label, optgroup=key
-                                )
-                            )
-                    else:
-                        result.append(SelectChoice(value=key, label=value))
-                return result
-            return [
-                SelectChoice.from_input(input, optgroup)
-                for optgroup, inputs in choices.items()
-                for input in inputs
-            ]
-
-        return [SelectChoice.from_input(input) for input in choices]
+        return _normalize_choices(choices)
 
     @staticmethod
     def _is_shorthand_dict(choices):
@@ -342,13 +609,72 @@ class SelectFieldBase(Field):
             return cb()
         return cb(self._form, self)
 
-    class _Option(Field):
+    class _Option:
+        """
+        One choice of the field, as yielded by iterating it, rendered by the
+        field's ``option_widget``.
+
+        Unlike a field, an option is not bound nor processed: it only holds
+        what its widget and label need. The options yielded by one iteration
+        share their ``flags``.
+        """
+
+        __slots__ = (
+            "id",
+            "name",
+            "label",
+            "checked",
+            "data",
+            "choice",
+            "widget",
+            "render_kw",
+            "validators",
+            "flags",
+            "meta",
+            "_form",
+        )
+
+        type = "_Option"
+        description = ""
+        errors = ()
+        process_errors = ()
+        raw_data = None
+        do_not_call_in_templates = True
+
+        def __init__(self, field, id, choice, flags):
+            self.id = id
+            self.name = field.name
+            self.label = Label(id, choice.label or choice.value)
+            self.checked = choice.selected
+            self.data = choice.value
+            self.choice = choice
+            self.widget = field.option_widget
+            self.render_kw = field.render_kw
+            self.validators = field.validators
+            self.flags = flags
+            self.meta = field.meta
+            self._form = field._form
+
+        @property
+        def short_name(self):
+            return self.name
+
         def _value(self):
             return str(self.data)
 
+        def __str__(self):
+            return self()
+
+        def __html__(self):
+            return self()
+
+        def __call__(self, **kwargs):
+            return self.meta.render_field(self, kwargs)
+
 
 class SelectField(SelectFieldBase):
     widget = widgets.Select()
+    _choice_index_cache = None
 
     def __init__(
         self,
@@ -368,8 +694,8 @@ class SelectField(SelectFieldBase):
             self.choices = None
         else:
             self._choices_callable = None
-            if choices is None:
-                self.choices = None
+            if choices is None or isinstance(choices, (ChoiceCatalog, ChoicesProvider)):
+                self.choices = choices
             else:
                 self._warn_legacy_choices(choices)
                 self.choices = (
@@ -383,35 +709,104 @@ class SelectField(SelectFieldBase):
             "Not a valid choice."
         )
 
+    def _clone(self, form, translations=None):
+        field = super()._clone(form, translations)
+        if isinstance(self.choices, dict):
+            field.choices = dict(self.choices)
+        elif self.choices is not None and not isinstance(
+            self.choices, (ChoiceCatalog, ChoicesProvider)
+        ):
+            field.choices = list(self.choices)
+        return field
+
+    def _choice_index(self):
+        """Return the :class:`_ChoiceIndex` of the current choices, only
+        normalized again when ``choices`` or ``coerce`` is reassigned.
+        Choices given as a callable are normalized on each call."""
+        choices = self.choices
+        if isinstance(choices, ChoiceCatalog) and choices.coerce is self.coerce:
+            return choices._index
+
+        index = self._choice_index_cache
+        if index is not None and index.is_current(choices, self.coerce):
+            return index
+
+        index = _ChoiceIndex(
+            choices, self._choices_from_input(choices) or [], self.coerce
+        )
+        if isinstance(choices, ChoiceCatalog):
+            index.escaped_labels = choices.escaped_labels
+            index.option_html = choices._index.option_html
+        if not callable(choices):
+            self._choice_index_cache = index
+        return index
+
+    def _selected_positions(self, index):
+        return index.positions_of(self.data)
+
+    def _selected_values(self):
+        return () if self.data is None else (self.data,)
+
+    def _provider_choices(self, provider):
+        """List the selected choices of ``provider`` not within its render
+        limit, followed by the choices within it."""
+        window = _normalize_choices(
+            list(provider.iter_window(0, provider.render_limit))
+        )
+        coerced = [self.coerce(c.value) for c in window]
+        data = self._selected_values()
+        choices = []
+        for value in data:
+            if value in coerced:
+                continue
+            label = provider.label_for(value)
+            if label is not None:
+                choices.append(Choice._make((value, label, True, {})))
+        for c, value in zip(window, coerced, strict=True):
+            choices.append(Choice._make((c.value, c.label, value in data, c.render_kw)))
+        return choices
+
+    def _render_choice_index(self):
+        """Return the :class:`_ChoiceIndex` the widget may render the options
+        from, or `None` if the way they are listed is customized."""
+        cls = type(self)
+        if (
+            cls.iter_choices is not SelectField.iter_choices
+            or cls.iter_groups is not SelectField.iter_groups
+            or cls.has_groups is not SelectField.has_groups
+            or isinstance(self.choices, ChoicesProvider)
+        ):
+            return None
+        return self._choice_index()
+
     def iter_choices(self):
-        choices = self._choices_from_input(self.choices) or []
+        if isinstance(self.choices, ChoicesProvider):
+            return self._provider_choices(self.choices)
+        index = self._choice_index()
+        selected = self._selected_positions(index)
         return [
-            Choice(
-                value=c.value,
-                label=c.label,
-                selected=self.coerce(c.value) == self.data,
-                render_kw=c.render_kw,
-            )
-            for c in choices
+            Choice._make((c.value, c.label, position in selected, c.render_kw))
+            for position, c in enumerate(index.choices)
         ]
 
     def has_groups(self):
-        choices = self._choices_from_input(self.choices) or []
-        return any(c.optgroup is not None for c in choices)
+        if isinstance(self.choices, ChoicesProvider):
+            return False
+        return self._choice_index().has_groups
 
     def iter_groups(self):
-        choices = self._choices_from_input(self.choices) or []
-        for optgroup, group in groupby(choices, key=attrgetter("optgroup")):
+        if isinstance(self.choices, ChoicesProvider):
+            yield None, self._provider_choices(self.choices)
+            return
+        index = self._choice_index()
+        selected = self._selected_positions(index)
+        groups = groupby(enumerate(index.choices), key=lambda item: item[1].optgroup)
+        for optgroup, group in groups:
             yield (
                 optgroup,
                 [
-                    Choice(
-                        value=c.value,
-                        label=c.label,
-                        selected=self.coerce(c.value) == self.data,
-                        render_kw=c.render_kw,
-                    )
-                    for c in group
+                    Choice._make((c.value, c.label, position in selected, c.render_kw))
+                    for position, c in group
                 ],
             )
 
@@ -446,7 +841,13 @@ class SelectField(SelectFieldBase):
         if self.choices is None:
             raise TypeError(self.gettext("Choices cannot be None."))
 
-        if not any(choice.selected for choice in self._iter_choices_normalized()):
+        if isinstance(self.choices, ChoicesProvider):
+            if not self.choices.contains(self.data):
+                raise ValidationError(self.invalid_choice_message)
+        elif type(self).iter_choices is SelectField.iter_choices:
+            if not self._choice_index().positions_of(self.data):
+                raise ValidationError(self.invalid_choice_message)
+        elif not any(choice.selected for choice in self._iter_choices_normalized()):
             raise ValidationError(self.invalid_choice_message)
 
 
@@ -488,35 +889,11 @@ class SelectMultipleField(SelectField):
         )
         self.invalid_choice_message = invalid_choice_message
 
-    def iter_choices(self):
-        choices = self._choices_from_input(self.choices) or []
-        data = self.data or ()
-        return [
-            Choice(
-                value=c.value,
-                label=c.label,
-                selected=self.coerce(c.value) in data,
-                render_kw=c.render_kw,
-            )
-            for c in choices
-        ]
+    def _selected_positions(self, index):
+        return index.selected(self.data or ())
 
-    def iter_groups(self):
-        choices = self._choices_from_input(self.choices) or []
-        data = self.data or ()
-        for optgroup, group in groupby(choices, key=attrgetter("optgroup")):
-            yield (
-                optgroup,
-                [
-                    Choice(
-                        value=c.value,
-                        label=c.label,
-                        selected=self.coerce(c.value) in data,
-                        render_kw=c.render_kw,
-                    )
-                    for c in group
-                ],
-            )
+    def _selected_values(self):
+        return self.data or ()
 
     def process_data(self, value):
         try:
@@ -540,13 +917,16 @@ class SelectMultipleField(SelectField):
         if self.choices is None:
             raise TypeError(self.gettext("Choices cannot be None."))
 
-        acceptable = {
-            self.coerce(choice.value) for choice in self._iter_choices_normalized()
-        }
-        if any(data not in acceptable for data in self.data):
-            unacceptable = [
-                str(data) for data in set(self.data) if data not in acceptable
-            ]
+        if isinstance(self.choices, ChoicesProvider):
+            accepts = self.choices.contains
+        elif type(self).iter_choices is SelectField.iter_choices:
+            accepts = self._choice_index().positions_of
+        else:
+            accepts = {
+                self.coerce(choice.value) for choice in self._iter_choices_normalized()
+            }.__contains__
+        if not all(accepts(data) for data in self.data):
+            unacceptable = [str(data) for data in set(self.data) if not accepts(data)]
             if callable(self.invalid_choice_message):
                 message = self.invalid_choice_message(len(unacceptable))
             elif self.invalid_choice_message is not None:
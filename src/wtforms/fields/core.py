@@ -1,3 +1,4 @@
+import functools
 import inspect
 import itertools
 
@@ -23,6 +24,9 @@ class Field:
     widget = None
     _formfield = True
     _translations = DummyTranslations()
+    # The attribute holding the fields enclosed in this one, whose renaming is
+    # deferred by _rename_field until it is accessed.
+    _descendants_attr = None
     do_not_call_in_templates = True  # Allow Django 1.4 traversal
 
     def __new__(cls, *args, **kwargs):
@@ -128,9 +132,7 @@ class Field:
         self.id = id or self.name
         self.label = Label(
             self.id,
-            label
-            if label is not None
-            else self.gettext(name.replace("_", " ").title()),
+            label if label is not None else self.gettext(_default_label_text(name)),
         )
 
         if widget is not None:
@@ -179,6 +181,46 @@ class Field:
         """
         return self.meta.render_field(self, kwargs)
 
+    def render_iter(self, **kwargs):
+        """
+        Render this field like :meth:`__call__`, yielding the HTML in chunks.
+
+        This delegates rendering to :meth:`meta.render_field_iter
+        <wtforms.meta.DefaultMeta.render_field_iter>`. Fields whose widget
+        renders subfields, like :class:`FieldList` and :class:`FormField`,
+        yield the HTML of one subfield at a time, so that it can be sent
+        by a streaming response without holding the whole page in memory.
+        """
+        return self.meta.render_field_iter(self, kwargs)
+
+    def _clone(self, form, translations=None):
+        """
+        Return a copy of this field bound to `form`.
+
+        This is used to instantiate fields from the per-class prototypes kept
+        when :attr:`~wtforms.meta.DefaultMeta.field_prototypes` is enabled.
+        Configuration is shared with the prototype, while state that is
+        commonly modified on a form instance (flags, label, ``render_kw``,
+        ``validators``, datalist) is copied. Subclasses holding other mutable
+        per-instance state should extend this method.
+        """
+        field = object.__new__(type(self))
+        field.__dict__.update(self.__dict__)
+        field._form = form
+        field.meta = form.meta
+        if translations is not None:
+            field._translations = translations
+        field.flags = Flags()
+        field.flags.__dict__.update(self.flags.__dict__)
+        field.label = Label(self.label.field_id, self.label.text)
+        if self.render_kw is not None:
+            field.render_kw = dict(self.render_kw)
+        if isinstance(self.validators, list):
+            field.validators = list(self.validators)
+        if self._datalist is not None and not isinstance(self._datalist, str):
+            field._datalist = self._datalist._clone(id=self._datalist.id)
+        return field
+
     def datalist(self, **kwargs):
         """Render the inline ``<datalist>`` bound to this field, or
         empty markup when there is none."""
@@ -235,28 +277,73 @@ class Field:
         :param form: The form the field belongs to.
         :param extra_validators: A sequence of extra validators to run.
         """
+        stop_validation = self._start_validation(form, extra_validators)
+
+        # Run validators
+        if not stop_validation:
+            chain, stop_on_error = self._validation_chain(extra_validators)
+            stop_validation = self._run_validation_chain(form, chain, stop_on_error)
+
+        return self._finish_validation(form, stop_validation)
+
+    async def validate_async(self, form, extra_validators=()):
+        """
+        Validates the field like :meth:`validate`, awaiting the validators
+        which are coroutine functions or otherwise return an awaitable, such
+        as ``async def`` validators doing I/O. This is usually only called by
+        :meth:`Form.validate_async <wtforms.form.BaseForm.validate_async>`.
+
+        Validators still run one after the other, so a validator raising
+        :class:`~wtforms.validators.StopValidation` prevents the next ones
+        from running. If :meth:`validate` is overridden, it is called
+        instead.
+
+        :param form: The form the field belongs to.
+        :param extra_validators: A sequence of extra validators to run.
+        """
+        if type(self).validate is not Field.validate:
+            return self.validate(form, extra_validators)
+
+        stop_validation = self._start_validation(form, extra_validators)
+
+        # Run validators
+        if not stop_validation:
+            chain, stop_on_error = self._validation_chain(extra_validators)
+            stop_validation = await self._run_validation_chain_async(
+                form, chain, stop_on_error
+            )
+
+        return self._finish_validation(form, stop_validation)
+
+    def _start_validation(self, form, extra_validators):
+        """Reset the errors and call :meth:`pre_validate`, returning `True` if
+        it stopped the validation."""
         self.errors = list(self.process_errors)
-        stop_validation = False
 
         # Check the type of extra_validators
         self.check_validators(extra_validators)
 
-        # Call pre_validate
         try:
             self.pre_validate(form)
         except StopValidation as e:
             if e.args and e.args[0]:
                 self.errors.append(e.args[0])
-            stop_validation = True
+            return True
         except ValidationError as e:
             self.errors.append(e.args[0])
+        return False
 
-        # Run validators
-        if not stop_validation:
-            chain = itertools.chain(self.validators, extra_validators)
-            stop_validation = self._run_validation_chain(form, chain)
+    def _validation_chain(self, extra_validators):
+        """Return the validators to run and whether to stop at the first
+        error, following :attr:`~wtforms.meta.DefaultMeta.cheap_validators_first`.
+        """
+        chain = itertools.chain(self.validators, extra_validators)
+        if self.meta.cheap_validators_first:
+            return _order_by_cost(chain), True
+        return chain, False
 
-        # Call post_validate
+    def _finish_validation(self, form, stop_validation):
+        """Call :meth:`post_validate` and return the validation result."""
         try:
             self.post_validate(form, stop_validation)
         except ValidationError as e:
@@ -264,23 +351,54 @@ class Field:
 
         return len(self.errors) == 0
 
-    def _run_validation_chain(self, form, validators):
+    def _run_validation_chain(self, form, validators, stop_on_error=False):
         """
         Run a validation chain, stopping if any validator raises StopValidation.
 
         :param form: The Form instance this field belongs to.
         :param validators: a sequence or iterable of validator callables.
+        :param stop_on_error: If `True`, also skip the remaining validators
+            once one raises ValidationError.
         :return: True if validation was stopped, False otherwise.
         """
         for validator in validators:
             try:
-                validator(form, self)
+                result = validator(form, self)
+            except StopValidation as e:
+                if e.args and e.args[0]:
+                    self.errors.append(e.args[0])
+                return True
+            except ValidationError as e:
+                self.errors.append(e.args[0])
+                if stop_on_error:
+                    break
+            else:
+                if result is not None and inspect.isawaitable(result):
+                    _discard_awaitable(result)
+                    raise TypeError(
+                        f"{validator!r} is asynchronous, use validate_async() to run it"
+                    )
+
+        return False
+
+    async def _run_validation_chain_async(self, form, validators, stop_on_error=False):
+        """
+        Run a validation chain like :meth:`_run_validation_chain`, awaiting
+        the results of asynchronous validators.
+        """
+        for validator in validators:
+            try:
+                result = validator(form, self)
+                if result is not None and inspect.isawaitable(result):
+                    await result
             except StopValidation as e:
                 if e.args and e.args[0]:
                     self.errors.append(e.args[0])
                 return True
             except ValidationError as e:
                 self.errors.append(e.args[0])
+                if stop_on_error:
+                    break
 
         return False
 
@@ -350,6 +468,18 @@ class Field:
         except ValueError as e:
             self.process_errors.append(e.args[0])
 
+    def reset(self):
+        """
+        Clear the errors and raw data left by the last processing and
+        validation, so the field can be processed again.
+
+        Called by :meth:`~wtforms.form.BaseForm.reprocess` before it processes
+        the form with new input.
+        """
+        self.errors = tuple()
+        self.process_errors = tuple()
+        self.raw_data = None
+
     def post_process(self, formdata=None):
         """Hook called after every field in the enclosing form has been processed.
 
@@ -397,17 +527,129 @@ class Field:
         setattr(obj, name, self.data)
 
 
+@functools.lru_cache(maxsize=1024)
+def _default_label_text(name):
+    """Label text derived from a field name, shared by all fields bound
+    under that name."""
+    return name.replace("_", " ").title()
+
+
+_creation_counter = itertools.count(1)
+
+
+def _validator_cost(validator):
+    return validator.cost
+
+
+def _order_by_cost(validators):
+    """Sort the validators declaring a ``cost`` cheapest first, within each
+    run of consecutive ones. Validators without a cost, such as those which
+    stop the chain, keep their position and split the runs.
+    """
+    ordered = []
+    run = []
+    for validator in validators:
+        if getattr(validator, "cost", None) is None:
+            ordered.extend(sorted(run, key=_validator_cost))
+            run = []
+            ordered.append(validator)
+        else:
+            run.append(validator)
+    ordered.extend(sorted(run, key=_validator_cost))
+    return ordered
+
+
+def _discard_awaitable(awaitable):
+    """Close a coroutine which will not be awaited, to avoid the warning about
+    it never being awaited."""
+    close = getattr(awaitable, "close", None)
+    if close is not None:
+        close()
+
+
+def _rename_field(field, name, id):
+    """
+    Give ``field`` a new ``name`` and ``id``, and its descendants the same
+    new prefix.
+
+    The descendants of a field declaring ``_descendants_attr`` are renamed
+    when that attribute is next accessed, by :func:`_restore_descendants`,
+    so renaming a field many times only renames its descendants once.
+    """
+    old_name = field.name
+    old_id = field.id
+    field.name = name
+    field.id = id
+    if field.label.field_id == old_id:
+        field.label.field_id = id
+
+    attr = field._descendants_attr
+    if attr is None:
+        for descendant in _iter_descendants(field):
+            if descendant.name and descendant.name.startswith(old_name):
+                descendant.name = name + descendant.name[len(old_name) :]
+            if descendant.id and descendant.id.startswith(old_id):
+                descendant_old_id = descendant.id
+                descendant.id = id + descendant.id[len(old_id) :]
+                if descendant.label.field_id == descendant_old_id:
+                    descendant.label.field_id = descendant.id
+        return
+
+    # If the attribute is already put aside, its fields still have the
+    # prefix of an earlier rename.
+    fields = field.__dict__
+    if attr in fields:
+        fields["_stale_descendants"] = (fields.pop(attr), old_name, old_id)
+
+
+def _restore_descendants(field):
+    """
+    Put back the ``_descendants_attr`` of a field renamed by
+    :func:`_rename_field` and return it, renaming the enclosed fields.
+    Return `None` if the field was not renamed.
+    """
+    stale = field.__dict__.pop("_stale_descendants", None)
+    if stale is None:
+        return None
+    value, old_name, old_id = stale
+    field.__dict__[field._descendants_attr] = value
+    children = getattr(value, "_fields", None)
+    for child in value if children is None else children.values():
+        name = child.name
+        if name and name.startswith(old_name):
+            name = field.name + name[len(old_name) :]
+        id = child.id
+        if id and id.startswith(old_id):
+            id = field.id + id[len(old_id) :]
+        if name != child.name or id != child.id:
+            _rename_field(child, name, id)
+    return value
+
+
+def _iter_descendants(field):
+    """Yield all fields below ``field`` recursively (form sub-fields and
+    FieldList entries)."""
+    if hasattr(field, "form") and hasattr(field.form, "_fields"):
+        for subfield in field.form._fields.values():
+            yield subfield
+            yield from _iter_descendants(subfield)
+    if hasattr(field, "entries"):
+        for subfield in field.entries:
+            yield subfield
+            yield from _iter_descendants(subfield)
+
+
 class UnboundField:
+    __slots__ = ("field_class", "args", "name", "kwargs", "creation_counter")
+
     _formfield = True
-    creation_counter = 0
 
     def __init__(self, field_class, *args, name=None, **kwargs):
-        UnboundField.creation_counter += 1
         self.field_class = field_class
         self.args = args
         self.name = name
         self.kwargs = kwargs
-        self.creation_counter = UnboundField.creation_counter
+        self.creation_counter = next(_creation_counter)
         validators = kwargs.get("validators")
         if validators:
             self.field_class.check_validators(validators)
@@ -423,6 +665,14 @@ class UnboundField:
         )
         return self.field_class(*self.args, **kw)
 
+    def __get__(self, instance, owner=None):
+        # A form using lazy field binding has not shadowed this class
+        # attribute yet, let it bind the field on first access.
+        resolve = getattr(instance, "_resolve_unbound_field", None)
+        if resolve is None:
+            return self
+        return resolve(self)
+
     def __repr__(self):
         return (
             "<UnboundField("
@@ -461,6 +711,8 @@ class Label:
     An HTML :mdn-tag:`label`.
     """
 
+    __slots__ = ("field_id", "text")
+
     def __init__(self, field_id, text):
         self.field_id = field_id
         self.text = text
@@ -1,10 +1,14 @@
 from wtforms.utils import unset_value
 
 from .. import widgets
+from .core import _restore_descendants
 from .core import Field
 
 __all__ = ("FormField",)
 
+# Keys of a data dict which cannot be passed on to BaseForm.reprocess.
+_REPROCESS_ARGUMENTS = frozenset(("formdata", "obj", "data", "extra_filters", "prefix"))
+
 
 class FormField(Field):
     """
@@ -18,6 +22,11 @@ class FormField(Field):
     """
 
     widget = widgets.TableWidget()
+    _descendants_attr = "form"
+
+    # The enclosed form kept by reset() to be reprocessed by process().
+    _spare_form = None
+    _form_reusable = False
 
     def __init__(
         self, form_class, label=None, validators=None, separator="-", **kwargs
@@ -52,17 +61,33 @@ class FormField(Field):
 
         self.object_data = data
 
+        # Rename the fields of a form renamed since reset() before reusing it.
+        _restore_descendants(self)
+        form = self._spare_form
+        self._spare_form = None
         prefix = self.name + self.separator
         if isinstance(data, dict):
             user_meta = data.get("meta") or {}
             data_kwargs = {k: v for k, v in data.items() if k != "meta"}
+            if (
+                form is not None
+                and not user_meta
+                and data_kwargs.keys().isdisjoint(_REPROCESS_ARGUMENTS)
+            ):
+                form.reprocess(formdata=formdata, **data_kwargs)
+                return
+            # A form given its own meta is not reused, see reset().
+            self._form_reusable = not user_meta
             self.form = self.form_class(
                 formdata=formdata,
                 prefix=prefix,
                 meta={**user_meta, "_parent_form": self._form},
                 **data_kwargs,
             )
+        elif form is not None:
+            form.reprocess(formdata=formdata, obj=data)
         else:
+            self._form_reusable = True
             self.form = self.form_class(
                 formdata=formdata,
                 obj=data,
@@ -70,6 +95,18 @@ class FormField(Field):
                 meta={"_parent_form": self._form},
             )
 
+    def reset(self):
+        """
+        Reset this field. The enclosed form is reprocessed by the next
+        :meth:`process` instead of being instantiated again, unless it was
+        or is given data with its own ``meta``.
+        """
+        self.process_errors = tuple()
+        self.raw_data = None
+        self._obj = None
+        if self._form_reusable:
+            self._spare_form = getattr(self, "form", None)
+
     def post_process(self, formdata=None):
         self.form.post_process(formdata)
 
@@ -81,6 +118,16 @@ class FormField(Field):
             )
         return self.form.validate()
 
+    async def validate_async(self, form, extra_validators=()):
+        if type(self).validate is not FormField.validate:
+            return self.validate(form, extra_validators)
+        if extra_validators:
+            raise TypeError(
+                "FormField does not accept in-line validators, as it"
+                " gets errors from the enclosed form."
+            )
+        return await self.form.validate_async()
+
     def populate_obj(self, obj, name):
         candidate = getattr(obj, name, None)
         if candidate is None:
@@ -101,6 +148,13 @@ class FormField(Field):
         return self.form[name]
 
     def __getattr__(self, name):
+        if name == "form":
+            form = _restore_descendants(self)
+            if form is None:
+                raise AttributeError(
+                    f"{type(self).__name__!r} object has no attribute 'form'"
+                )
+            return form
         return getattr(self.form, name)
 
     @property
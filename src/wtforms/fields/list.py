@@ -1,13 +1,26 @@
+import asyncio
+import contextvars
 import itertools
 
+from wtforms.utils import _formdata_index
+from wtforms.utils import _index_formdata
+from wtforms.utils import _keys_with_prefix
 from wtforms.utils import unset_value
 
 from .. import widgets
+from .core import _default_label_text
+from .core import _rename_field
+from .core import _restore_descendants
 from .core import Field
 from .core import UnboundField
 
 __all__ = ("FieldList",)
 
+# The executors running the entry validation of the current thread, so that
+# lists nested in an entry validate inline rather than wait for a worker of
+# an executor they are already holding.
+_running_executors = contextvars.ContextVar("wtforms_running_executors", default=())
+
 
 class FieldList(Field):
     """
@@ -29,9 +42,33 @@ class FieldList(Field):
     :param separator:
         A string which will be suffixed to this field's name to create the
         prefix to enclosed list entries. The default is fine for most uses.
+    :param executor:
+        A :class:`concurrent.futures.Executor`, such as a thread pool, used
+        by :meth:`validate` to validate the entries concurrently. Useful when
+        the enclosed field has I/O-bound validators, which must then be safe
+        to call from several threads. Errors are still collected in entry
+        order. Lists nested in the entries validate their own entries inline
+        when they use the same executor.
+    :param columnar:
+        Keep the data, raw data and errors of the entries in lists, and
+        process, validate and populate them with a single field bound like
+        an entry, instead of binding a field per entry. The fields in
+        :attr:`entries` are only bound when it is accessed, such as when
+        the list is iterated, indexed or rendered. Only for enclosed fields
+        which do not enclose other fields themselves. Entries are then
+        validated one after the other, without ``executor``.
     """
 
     widget = widgets.ListWidget()
+    _descendants_attr = "entries"
+
+    # Entries kept by reset() to be reused by the next process(), last first.
+    _spare_entries = ()
+    # The state of the entries of a columnar list until they are bound.
+    _columns = None
+    # Whether the labels of the entries are derived from their names, set
+    # when the first entry is bound.
+    _default_entry_labels = None
 
     def __init__(
         self,
@@ -42,6 +79,8 @@ class FieldList(Field):
         max_entries=None,
         separator="-",
         default=(),
+        executor=None,
+        columnar=False,
         **kwargs,
     ):
         super().__init__(label, validators, default=default, **kwargs)
@@ -60,6 +99,13 @@ class FieldList(Field):
         self._prefix = kwargs.get("_prefix", "")
         self._separator = separator
         self._field_separator = unbound_field.kwargs.get("separator", "-")
+        self.executor = executor
+        if columnar and unbound_field.field_class._descendants_attr is not None:
+            raise TypeError(
+                "A columnar FieldList cannot enclose fields which enclose"
+                " other fields, such as FormField or FieldList."
+            )
+        self.columnar = columnar
 
     def process(self, formdata, data=unset_value, extra_filters=None):
         if extra_filters:
@@ -69,6 +115,7 @@ class FieldList(Field):
             )
 
         self.last_index = -1
+        self._columns = None
         self.entries = []
         if data is unset_value or not data:
             try:
@@ -78,20 +125,16 @@ class FieldList(Field):
 
         self.object_data = data
 
-        if formdata:
-            indices = sorted(set(self._extract_indices(self.name, formdata)))
-            if self.max_entries:
-                indices = indices[: self.max_entries]
+        if self.columnar and self._process_columns(formdata, data):
+            return
 
-            data_list = list(data) if data else []
-            for index in indices:
-                if index < len(data_list):
-                    obj_data = data_list[index]
-                else:
-                    obj_data = unset_value
-                self._add_entry(formdata, obj_data, index=index)
-
-            self._compact_indices()
+        if formdata:
+            token = _index_formdata(formdata)
+            try:
+                self._process_formdata_entries(formdata, data)
+            finally:
+                if token is not None:
+                    _formdata_index.reset(token)
         else:
             for obj_data in data:
                 self._add_entry(formdata, obj_data)
@@ -99,6 +142,113 @@ class FieldList(Field):
         while len(self.entries) < self.min_entries:
             self._add_entry(formdata)
 
+    def _process_formdata_entries(self, formdata, data):
+        indices = sorted(set(self._extract_indices(self.name, formdata)))
+        if self.max_entries:
+            indices = indices[: self.max_entries]
+
+        data_list = list(data) if data else []
+        for index in indices:
+            if index < len(data_list):
+                obj_data = data_list[index]
+            else:
+                obj_data = unset_value
+            self._add_entry(formdata, obj_data, index=index)
+
+        self._compact_indices()
+
+    def _process_columns(self, formdata, data):
+        """
+        Process the entries of a columnar list into :class:`_EntryColumns`,
+        returning `False` if the enclosed field keeps other state.
+        """
+        field, state, attrs = self._column_field()
+        if field is None:
+            return False
+
+        if formdata:
+            token = _index_formdata(formdata)
+            try:
+                indices = sorted(set(self._extract_indices(self.name, formdata)))
+            finally:
+                if token is not None:
+                    _formdata_index.reset(token)
+            if self.max_entries:
+                indices = indices[: self.max_entries]
+            data_list = list(data) if data else []
+            entries = [
+                (index, data_list[index] if index < len(data_list) else unset_value)
+                for index in indices
+            ]
+        else:
+            entries = list(enumerate(data))
+        while len(entries) < self.min_entries:
+            entries.append((len(entries), unset_value))
+
+        columns = _EntryColumns()
+        for position, (index, obj_data) in enumerate(entries):
+            assert not self.max_entries or position < self.max_entries, (
+                "You cannot have more than max_entries entries in this FieldList"
+            )
+            self._load_entry(field, state, index)
+            field.process(formdata, obj_data)
+            if not field.__dict__.keys() <= attrs:
+                return False
+            columns.append(field, index)
+
+        self.__dict__.pop("entries", None)
+        self._columns = columns
+        self.last_index = len(entries) - 1
+        return True
+
+    def _column_field(self):
+        """
+        Return a field bound like an entry to process, validate and populate
+        each entry of a columnar list, its state once bound, and the names of
+        the attributes it may have once processed; or `None` for each if the
+        enclosed field can't be held in columns.
+        """
+        cached = self.__dict__.get("_column_field_state")
+        if cached is None:
+            field = self._bind_entry(0)
+            if (
+                field._datalist is not None
+                or type(field).post_process is not Field.post_process
+            ):
+                cached = None, None, None
+            else:
+                state = dict(field.__dict__)
+                attrs = state.keys() | _EntryColumns.__slots__
+                cached = field, state, attrs | {"name", "id", "short_name", "index"}
+            self._column_field_state = cached
+        return cached
+
+    def _load_entry(self, field, state, index, columns=None, position=None):
+        """Give ``field`` the state of the entry at ``index`` of a columnar
+        list, processed if ``columns`` is given."""
+        fields = field.__dict__
+        fields.clear()
+        fields.update(state)
+        field.name = f"{self.name}{self._separator}{index}"
+        field.id = f"{self.id}{self._separator}{index}"
+        field.short_name = f"{self.short_name}{self._separator}{index}"
+        field.index = index
+        if columns is not None:
+            columns.load(field, position)
+
+    def _materialize(self):
+        """Bind the entries of a columnar list and return them, numbered as
+        they would have been if bound when processed."""
+        columns = self._columns
+        self._columns = None
+        self.entries = entries = []
+        for position, index in enumerate(columns.indices):
+            field = self._bind_entry(index)
+            columns.load(field, position)
+            entries.append(field)
+        self._compact_indices()
+        return entries
+
     def _extract_indices(self, prefix, formdata):
         """
         Yield indices of any keys with given prefix.
@@ -108,13 +258,31 @@ class FieldList(Field):
         the numbers 0 and 1 will be yielded, but not necessarily in order.
         """
         offset = len(prefix) + 1
-        for k in formdata:
-            if k.startswith(prefix):
-                k = k[offset:].split(self._field_separator, 1)[0]
-                if k.isdigit():
-                    yield int(k)
+        for k in _keys_with_prefix(formdata, prefix):
+            k = k[offset:].split(self._field_separator, 1)[0]
+            if k.isdigit():
+                yield int(k)
+
+    def reset(self):
+        """
+        Reset this field and its entries. The entries are reused, in order,
+        by the next :meth:`process` instead of binding new fields.
+        """
+        super().reset()
+        if self._columns is not None:
+            self._columns = None
+            self.entries = []
+            return
+        entries = getattr(self, "entries", [])
+        for entry in entries:
+            entry.reset()
+        self._spare_entries = [*self._spare_entries, *reversed(entries)]
+        self.entries = []
 
     def post_process(self, formdata=None):
+        # The entries of a columnar list have nothing to post-process.
+        if self._columns is not None:
+            return
         for entry in self.entries:
             entry.post_process(formdata)
 
@@ -129,19 +297,95 @@ class FieldList(Field):
         self.errors = []
 
         # Run validators on all entries within
-        for subfield in self.entries:
-            subfield.validate(form)
-            self.errors.append(subfield.errors)
+        if self._columns is None or not self._validate_columns(form):
+            executor = self.executor
+            if (
+                executor is not None
+                and len(self.entries) > 1
+                and executor not in _running_executors.get()
+            ):
+                futures = [
+                    executor.submit(_validate_in_executor, executor, subfield, form)
+                    for subfield in self.entries
+                ]
+                for future in futures:
+                    future.result()
+            else:
+                for subfield in self.entries:
+                    subfield.validate(form)
+            self.errors = [subfield.errors for subfield in self.entries]
+
+        if not any(x for x in self.errors):
+            self.errors = []
+
+        chain, stop_on_error = self._validation_chain(extra_validators)
+        self._run_validation_chain(form, chain, stop_on_error)
+
+        return len(self.errors) == 0
+
+    async def validate_async(self, form, extra_validators=()):
+        """
+        Validate this FieldList like :meth:`validate`, validating the enclosed
+        fields concurrently with :meth:`~wtforms.fields.Field.validate_async`.
+        """
+        if type(self).validate is not FieldList.validate:
+            return self.validate(form, extra_validators)
+
+        self.errors = []
+
+        # Run validators on all entries within
+        if self._columns is None or not await self._validate_columns_async(form):
+            await asyncio.gather(
+                *(subfield.validate_async(form) for subfield in self.entries)
+            )
+            self.errors = [subfield.errors for subfield in self.entries]
 
         if not any(x for x in self.errors):
             self.errors = []
 
-        chain = itertools.chain(self.validators, extra_validators)
-        self._run_validation_chain(form, chain)
+        chain, stop_on_error = self._validation_chain(extra_validators)
+        await self._run_validation_chain_async(form, chain, stop_on_error)
 
         return len(self.errors) == 0
 
+    def _validate_columns(self, form):
+        """Validate the entries of a columnar list, setting :attr:`errors`.
+        Return `False`, binding the entries, if they must be validated as
+        fields."""
+        field, state, attrs = self._column_field()
+        columns = self._columns
+        for position in range(len(columns)):
+            self._load_entry(field, state, position, columns, position)
+            field.validate(form)
+            if not field.__dict__.keys() <= attrs:
+                self._materialize()
+                return False
+            columns.store(field, position)
+        self.errors = columns.errors or []
+        return True
+
+    async def _validate_columns_async(self, form):
+        """Validate the entries of a columnar list like
+        :meth:`_validate_columns`, one after the other."""
+        field, state, attrs = self._column_field()
+        columns = self._columns
+        for position in range(len(columns)):
+            self._load_entry(field, state, position, columns, position)
+            await field.validate_async(form)
+            if not field.__dict__.keys() <= attrs:
+                self._materialize()
+                return False
+            columns.store(field, position)
+        self.errors = columns.errors or []
+        return True
+
     def populate_obj(self, obj, name):
+        columns = self._columns
+        if columns is not None:
+            field = self._column_field()[0]
+            if type(field).populate_obj is Field.populate_obj:
+                setattr(obj, name, list(columns.data))
+                return
         values = getattr(obj, name, None)
         try:
             ivalues = iter(values)
@@ -170,19 +414,38 @@ class FieldList(Field):
         if index is None:
             index = self.last_index + 1
         self.last_index = index
+        if self._spare_entries:
+            field = self._spare_entries.pop()
+            self._rename_entry(field, index)
+            if self._default_entry_labels:
+                # Label the entry as if it was bound for this index.
+                name = f"{self.short_name}{self._separator}{index}"
+                field.label.text = field.gettext(_default_label_text(name))
+        else:
+            field = self._bind_entry(index)
+        field.process(formdata, data)
+        self.entries.append(field)
+        return field
+
+    def _bind_entry(self, index):
         name = f"{self.short_name}{self._separator}{index}"
         id = f"{self.id}{self._separator}{index}"
+        # The prefix this list was bound with is outdated once the list
+        # is renamed as an entry of an enclosing list.
+        prefix = self.name[: len(self.name) - len(self.short_name)]
         options = dict(
             name=name,
-            prefix=self._prefix,
+            prefix=prefix,
             id=id,
             _meta=self.meta,
             translations=self._translations,
         )
         field = self.meta.bind_field(self._form, self.unbound_field, options)
         field.index = index
-        field.process(formdata, data)
-        self.entries.append(field)
+        if self._default_entry_labels is None:
+            self._default_entry_labels = field.label.text == field.gettext(
+                _default_label_text(name)
+            )
         return field
 
     def _compact_indices(self):
@@ -192,37 +455,17 @@ class FieldList(Field):
         self.last_index = len(self.entries) - 1
 
     def _rename_entry(self, entry, new_index):
-        """Rename ``entry`` to ``new_index`` and propagate to its descendants."""
-        old_name = entry.name
-        old_id = entry.id
-        new_name = f"{self.short_name}{self._separator}{new_index}"
+        """Rename ``entry`` to ``new_index`` and propagate to its descendants,
+        once they are next accessed."""
+        new_name = f"{self.name}{self._separator}{new_index}"
         new_id = f"{self.id}{self._separator}{new_index}"
 
-        if old_name == new_name and old_id == new_id and entry.index == new_index:
+        if entry.name == new_name and entry.id == new_id and entry.index == new_index:
             return
 
         entry.index = new_index
-        entry.name = new_name
         entry.short_name = str(new_index)
-        entry.id = new_id
-
-        for descendant in self._iter_descendants(entry):
-            if descendant.name and descendant.name.startswith(old_name):
-                descendant.name = new_name + descendant.name[len(old_name) :]
-            if descendant.id and descendant.id.startswith(old_id):
-                descendant.id = new_id + descendant.id[len(old_id) :]
-
-    def _iter_descendants(self, field):
-        """Yield all fields below ``field`` recursively (form sub-fields and
-        FieldList entries)."""
-        if hasattr(field, "form") and hasattr(field.form, "_fields"):
-            for subfield in field.form._fields.values():
-                yield subfield
-                yield from self._iter_descendants(subfield)
-        if hasattr(field, "entries"):
-            for subfield in field.entries:
-                yield subfield
-                yield from self._iter_descendants(subfield)
+        _rename_field(entry, new_name, new_id)
 
     def append_entry(self, data=unset_value):
         """
@@ -259,10 +502,23 @@ class FieldList(Field):
         self._compact_indices()
         return entry
 
+    def __getattr__(self, name):
+        if name == "entries":
+            entries = _restore_descendants(self)
+            if entries is not None:
+                return entries
+            if self._columns is not None:
+                return self._materialize()
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
     def __iter__(self):
         return iter(self.entries)
 
     def __len__(self):
+        if self._columns is not None:
+            return len(self._columns)
         return len(self.entries)
 
     def __getitem__(self, index):
@@ -270,4 +526,61 @@ class FieldList(Field):
 
     @property
     def data(self):
+        if self._columns is not None:
+            return list(self._columns.data)
         return [f.data for f in self.entries]
+
+
+def _validate_in_executor(executor, field, form):
+    """Validate ``field`` in a task of ``executor``."""
+    token = _running_executors.set((*_running_executors.get(), executor))
+    try:
+        return field.validate(form)
+    finally:
+        _running_executors.reset(token)
+
+
+class _EntryColumns:
+    """The state of the entries of a columnar :class:`FieldList`, with a
+    list per attribute of the entries."""
+
+    __slots__ = (
+        "indices",
+        "data",
+        "raw_data",
+        "object_data",
+        "process_errors",
+        "errors",
+    )
+
+    def __init__(self):
+        self.indices = []
+        self.data = []
+        self.raw_data = []
+        self.object_data = []
+        self.process_errors = []
+        self.errors = None
+
+    def __len__(self):
+        return len(self.data)
+
+    def append(self, field, index):
+        self.indices.append(index)
+        self.data.append(field.data)
+        self.raw_data.append(field.raw_data)
+        self.object_data.append(field.object_data)
+        self.process_errors.append(field.process_errors)
+
+    def load(self, field, position):
+        field.data = self.data[position]
+        field.raw_data = self.raw_data[position]
+        field.object_data = self.object_data[position]
+        field.process_errors = self.process_errors[position]
+        if self.errors is not None:
+            field.errors = self.errors[position]
+
+    def store(self, field, position):
+        if self.errors is None:
+            self.errors = [()] * len(self.data)
+        self.data[position] = field.data
+        self.errors[position] = field.errors
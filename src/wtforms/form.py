@@ -1,13 +1,88 @@
+import asyncio
+import bisect
 import itertools
+import sys
+from collections import deque
 from collections import OrderedDict
 
 from wtforms.meta import DefaultMeta
+from wtforms.utils import _formdata_index
+from wtforms.utils import _index_formdata
+from wtforms.utils import DictInputWrapper
 from wtforms.utils import unset_value
 
-__all__ = ("BaseForm", "Form")
+__all__ = ("BaseForm", "Form", "FormPool")
 
 _default_meta = DefaultMeta()
 
+# Upper bound on the number of (prefix, locales) prototype sets kept per form
+# class, so forms instantiated under many prefixes (for example as FieldList
+# entries) do not grow the cache without limit.
+_MAX_PROTOTYPE_SETS = 32
+
+
+class _PendingField:
+    """Placeholder kept in :attr:`BaseForm._fields` for a field which has not
+    been bound yet, along with the processing calls it has missed."""
+
+    __slots__ = ("unbound_field", "options", "process_args", "post_process_args")
+
+    def __init__(self, unbound_field, options):
+        self.unbound_field = unbound_field
+        self.options = options
+        self.process_args = None
+        self.post_process_args = None
+
+
+class _LazyFields(OrderedDict):
+    """The fields of a form using :attr:`~wtforms.meta.DefaultMeta.lazy_fields`.
+
+    Values are bound and processed as soon as they are looked up; iterating
+    the values binds every remaining field.
+    """
+
+    def __init__(self, form):
+        super().__init__()
+        self.form = form
+
+    def __getitem__(self, name):
+        field = super().__getitem__(name)
+        if isinstance(field, _PendingField):
+            field = self.form._bind_pending_field(name, field)
+        return field
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def pop(self, name, *args):
+        field = super().pop(name, *args)
+        if isinstance(field, _PendingField):
+            return self.form._bind_pending_field(name, field, store=False)
+        return field
+
+    def values(self):
+        self.bind_all()
+        return super().values()
+
+    def items(self):
+        self.bind_all()
+        return super().items()
+
+    def bind_all(self):
+        for name, field in OrderedDict.items(self):
+            if isinstance(field, _PendingField):
+                self.form._bind_pending_field(name, field)
+
+    def copy(self):
+        """Bind every field and return them in a plain :class:`OrderedDict`."""
+        return OrderedDict(self.items())
+
+    def __reduce__(self):
+        return OrderedDict, (list(self.items()),)
+
 
 class BaseForm:
     """
@@ -35,7 +110,8 @@ class BaseForm:
         self._parent_form = getattr(meta, "_parent_form", None)
         self._form_error_key = ""
         self._prefix = prefix
-        self._fields = OrderedDict()
+        lazy = meta.lazy_fields
+        self._fields = _LazyFields(self) if lazy else OrderedDict()
 
         if hasattr(fields, "items"):
             fields = fields.items()
@@ -49,11 +125,34 @@ class BaseForm:
         for name, unbound_field in itertools.chain(fields, extra_fields):
             field_name = unbound_field.name or name
             options = dict(name=field_name, prefix=prefix, translations=translations)
-            field = meta.bind_field(self, unbound_field, options)
-            self._fields[name] = field
+            if lazy:
+                self._fields[name] = _PendingField(unbound_field, options)
+            else:
+                self._fields[name] = self._bind_field(name, unbound_field, options)
 
         self.form_errors = []
 
+    def _bind_field(self, name, unbound_field, options):
+        """Bind ``unbound_field`` to this form through
+        :meth:`~wtforms.meta.DefaultMeta.bind_field`.
+        """
+        return self.meta.bind_field(self, unbound_field, options)
+
+    def _bind_pending_field(self, name, pending, store=True):
+        """Bind a field left pending by
+        :attr:`~wtforms.meta.DefaultMeta.lazy_fields`, then replay the
+        :meth:`process` and :meth:`post_process` calls it missed.
+        """
+        field = self._bind_field(name, pending.unbound_field, pending.options)
+        if pending.process_args is not None:
+            formdata, data, extra_filters = pending.process_args
+            field.process(formdata, data, extra_filters=extra_filters)
+        if pending.post_process_args is not None:
+            field.post_process(*pending.post_process_args)
+        if store:
+            OrderedDict.__setitem__(self._fields, name, field)
+        return field
+
     def __iter__(self):
         """Iterate form fields in creation order."""
         return iter(self._fields.values())
@@ -114,12 +213,23 @@ class BaseForm:
 
         filters = extra_filters.copy() if extra_filters is not None else {}
 
-        for name, field in self._fields.items():
+        token = _index_formdata(formdata)
+        try:
+            self._process_fields(formdata, obj, kwargs, filters)
+        finally:
+            if token is not None:
+                _formdata_index.reset(token)
+
+        if self._parent_form is None:
+            self.post_process(formdata)
+
+    def _process_fields(self, formdata, obj, kwargs, filters):
+        for name, field in OrderedDict.items(self._fields):
             field_extra_filters = filters.get(name, [])
 
             inline_filter = getattr(self, f"filter_{name}", None)
             if inline_filter is not None:
-                field_extra_filters.append(inline_filter)
+                field_extra_filters = [*field_extra_filters, inline_filter]
 
             if obj is not None and hasattr(obj, name):
                 data = getattr(obj, name)
@@ -128,10 +238,12 @@ class BaseForm:
             else:
                 data = unset_value
 
-            field.process(formdata, data, extra_filters=field_extra_filters)
+            if isinstance(field, _PendingField):
+                field.process_args = (formdata, data, field_extra_filters)
+                field.post_process_args = None
+                continue
 
-        if self._parent_form is None:
-            self.post_process(formdata)
+            field.process(formdata, data, extra_filters=field_extra_filters)
 
     def post_process(self, formdata=None):
         """Hook called at the end of :meth:`process` on the root form.
@@ -152,9 +264,54 @@ class BaseForm:
         and :meth:`fields.FieldList.post_process`, so every nested field's
         ``post_process`` runs exactly once per processing cycle.
         """
-        for field in self._fields.values():
+        for field in OrderedDict.values(self._fields):
+            if isinstance(field, _PendingField):
+                field.post_process_args = (formdata,)
+                continue
             field.post_process(formdata)
 
+    def reprocess(
+        self, formdata=None, obj=None, data=None, extra_filters=None, **kwargs
+    ):
+        """Reuse this form for new input.
+
+        Clears :attr:`form_errors` and resets every field with
+        :meth:`~fields.Field.reset`, dropping their errors and raw data, then
+        calls :meth:`process` with the given arguments. The bound fields are
+        kept, including the entries of :class:`~fields.FieldList` and the
+        forms enclosed by :class:`~fields.FormField`, so no field is
+        constructed again unless the new input needs more list entries.
+        """
+        self.form_errors = []
+        for field in OrderedDict.values(self._fields):
+            if not isinstance(field, _PendingField):
+                field.reset()
+        self.process(formdata, obj, data=data, extra_filters=extra_filters, **kwargs)
+
+    def validate_many(self, inputs, extra_validators=None):
+        """Validate a stream of records with this form.
+
+        Each record is processed with :meth:`reprocess` and validated in turn,
+        so a single set of bound fields is used whatever the number of
+        records. This yields an ``(index, data, errors)`` tuple per record,
+        with copies of :attr:`data` and :attr:`errors`, and error messages
+        which are plain strings interned so that repeated messages are only
+        stored once.
+
+        :param inputs: An iterable of formdata. Plain dicts are accepted and
+            wrapped with ``wtforms.utils.DictInputWrapper``.
+        :param extra_validators: Passed on to :meth:`validate`.
+        """
+        for index, formdata in enumerate(inputs):
+            if isinstance(formdata, dict) and not hasattr(formdata, "getlist"):
+                formdata = DictInputWrapper(formdata)
+            self.reprocess(formdata)
+            if extra_validators is None:
+                self.validate()
+            else:
+                self.validate(extra_validators)
+            yield index, self.data, _intern_errors(self.errors)
+
     def validate(self, extra_validators=None):
         """
         Validates the form by calling `validate` on each field.
@@ -176,6 +333,39 @@ class BaseForm:
                 success = False
         return success
 
+    async def validate_async(self, extra_validators=None):
+        """
+        Validates the form like :meth:`validate`, but calling
+        :meth:`~wtforms.fields.Field.validate_async` on each field so that
+        ``async def`` validators can be used. The fields are validated
+        concurrently with :func:`asyncio.gather`, each field running its own
+        validators in order.
+
+        :param extra_validators:
+            If provided, is a dict mapping field names to a sequence of
+            callables which will be passed as extra validators to the field's
+            `validate_async` method.
+
+        If :meth:`validate` is overridden, such as to check fields against
+        each other, it is called instead.
+
+        Returns `True` if no errors occur.
+        """
+        if type(self).validate is not BaseForm.validate:
+            return self.validate(extra_validators)
+        return await self._validate_fields_async(extra_validators)
+
+    async def _validate_fields_async(self, extra_validators):
+        validations = []
+        for name, field in self._fields.items():
+            if extra_validators is not None and name in extra_validators:
+                extra = extra_validators[name]
+            else:
+                extra = tuple()
+            validations.append(field.validate_async(self, extra))
+        results = await asyncio.gather(*validations)
+        return all(results)
+
     @property
     def data(self):
         return {name: f.data for name, f in self._fields.items()}
@@ -188,44 +378,94 @@ class BaseForm:
         return errors
 
 
+def _intern_errors(errors):
+    """Copy an :attr:`BaseForm.errors` structure, interning the messages
+    which are plain strings."""
+    if isinstance(errors, dict):
+        return {name: _intern_errors(value) for name, value in errors.items()}
+    if isinstance(errors, list | tuple):
+        return [_intern_errors(value) for value in errors]
+    if type(errors) is str:
+        return sys.intern(errors)
+    return errors
+
+
+class FormPool:
+    """
+    A pool of instances of a form class, reused across submissions with
+    :meth:`BaseForm.reprocess`.
+
+    :param form_class: The :class:`Form` subclass to instantiate.
+    :param prefix: The prefix of the pooled forms.
+    :param meta: The meta overrides of the pooled forms.
+    :param maxsize: The maximum number of idle forms kept by the pool.
+
+    A form returned by :meth:`acquire` must not be used anymore once it has
+    been given back with :meth:`release`.
+    """
+
+    def __init__(self, form_class, prefix="", meta=None, maxsize=16):
+        self.form_class = form_class
+        self.prefix = prefix
+        self.meta = meta
+        self.maxsize = maxsize
+        self._idle = deque()
+
+    def acquire(self, formdata=None, obj=None, data=None, **kwargs):
+        """Return a form processed with the given input, reusing an idle
+        form if there is one. Takes the same arguments as :meth:`Form.process`.
+        """
+        try:
+            form = self._idle.pop()
+        except IndexError:
+            return self.form_class(
+                formdata, obj, prefix=self.prefix, data=data, meta=self.meta, **kwargs
+            )
+        form.reprocess(formdata, obj, data=data, **kwargs)
+        return form
+
+    def release(self, form):
+        """Give ``form`` back to the pool, unless the pool is full."""
+        if len(self._idle) < self.maxsize:
+            self._idle.append(form)
+
+    def __len__(self):
+        return len(self._idle)
+
+
 class FormMeta(type):
     """
     The metaclass for `Form` and any subclasses of `Form`.
 
     `FormMeta`'s responsibility is to create the `_unbound_fields` list, which
     is a list of `UnboundField` instances sorted by their order of
-    instantiation.  The list is created at the first instantiation of the form.
-    If any fields are added/removed from the form, the list is cleared to be
-    re-generated on the next instantiation.
+    instantiation.  The list is created along with the class, from the lists
+    of its bases and its own attributes. If any fields are added/removed from
+    the form or one of its bases, the list is updated in place.
 
     Any properties which begin with an underscore or are not `UnboundField`
     instances are ignored by the metaclass.
+
+    When :attr:`~wtforms.meta.DefaultMeta.field_prototypes` is enabled,
+    `FormMeta` also keeps the bound field prototypes for the class, which are
+    dropped whenever `_unbound_fields` or `_wtforms_meta` change.
     """
 
     def __init__(cls, name, bases, attrs):
         type.__init__(cls, name, bases, attrs)
-        cls._unbound_fields = None
+        cls._unbound_fields = cls._collect_unbound_fields()
         cls._wtforms_meta = None
+        cls._wtforms_prototypes = {}
 
     def __call__(cls, *args, **kwargs):
         """
         Construct a new `Form` instance.
 
-        Creates the `_unbound_fields` list and the internal `_wtforms_meta`
-        subclass of the class Meta in order to allow a proper inheritance
-        hierarchy.
+        Creates the internal `_wtforms_meta` subclass of the class Meta in
+        order to allow a proper inheritance hierarchy.
         """
         if cls._unbound_fields is None:
-            fields = []
-            for name in dir(cls):
-                if not name.startswith("_"):
-                    unbound_field = getattr(cls, name)
-                    if hasattr(unbound_field, "_formfield"):
-                        fields.append((name, unbound_field))
-            # We keep the name as the second element of the sort
-            # to ensure a stable sort.
-            fields.sort(key=lambda x: (x[1].creation_counter, x[0]))
-            cls._unbound_fields = fields
+            cls._unbound_fields = cls._collect_unbound_fields()
 
         # Create a subclass of the 'class Meta' using all the ancestors.
         if cls._wtforms_meta is None:
@@ -239,22 +479,85 @@ class FormMeta(type):
 
     def __setattr__(cls, name, value):
         """
-        Add an attribute to the class, clearing `_unbound_fields` if needed.
+        Add an attribute to the class, updating `_unbound_fields` if needed.
         """
+        type.__setattr__(cls, name, value)
         if name == "Meta":
             cls._wtforms_meta = None
-        elif not name.startswith("_") and hasattr(value, "_formfield"):
-            cls._unbound_fields = None
-        type.__setattr__(cls, name, value)
+            cls._wtforms_prototypes = {}
+        elif not name.startswith("_"):
+            cls._update_unbound_field(name)
 
     def __delattr__(cls, name):
         """
-        Remove an attribute from the class, clearing `_unbound_fields` if
+        Remove an attribute from the class, updating `_unbound_fields` if
         needed.
         """
-        if not name.startswith("_"):
-            cls._unbound_fields = None
         type.__delattr__(cls, name)
+        if not name.startswith("_"):
+            cls._update_unbound_field(name)
+
+    def _collect_unbound_fields(cls):
+        """Build the sorted `_unbound_fields` list of the class.
+
+        Only the names found in the lists of `Form` bases, in other bases and
+        in the class itself are looked up, rather than everything in
+        ``dir(cls)``.
+        """
+        attrs = vars(cls)
+        base = cls.__bases__[0] if len(cls.__bases__) == 1 else None
+        base_fields = getattr(base, "_unbound_fields", None)
+        if isinstance(base, FormMeta) and base_fields is not None:
+            # With a single form base, its fields are inherited as they are
+            # unless the class overrides them.
+            fields = [field for field in base_fields if field[0] not in attrs]
+            names = attrs
+        else:
+            fields = []
+            names = set(attrs)
+            for base in cls.__bases__:
+                base_fields = getattr(base, "_unbound_fields", None)
+                if isinstance(base, FormMeta) and base_fields is not None:
+                    names.update(name for name, _ in base_fields)
+                else:
+                    for mro_class in base.__mro__:
+                        names.update(vars(mro_class))
+
+        for name in names:
+            if not name.startswith("_"):
+                unbound_field = getattr(cls, name, None)
+                if hasattr(unbound_field, "_formfield"):
+                    fields.append((name, unbound_field))
+        # We keep the name as the second element of the sort
+        # to ensure a stable sort.
+        fields.sort(key=_unbound_field_sort_key)
+        return fields
+
+    def _update_unbound_field(cls, name):
+        """Update the `_unbound_fields` entry for ``name`` after it has been
+        set or deleted, on the class and on the subclasses inheriting it.
+
+        A new list replaces the old one so that forms being instantiated
+        meanwhile keep iterating a consistent list.
+        """
+        if cls._unbound_fields is not None:
+            fields = [field for field in cls._unbound_fields if field[0] != name]
+            unbound_field = getattr(cls, name, None)
+            if hasattr(unbound_field, "_formfield"):
+                bisect.insort(
+                    fields, (name, unbound_field), key=_unbound_field_sort_key
+                )
+            if fields != cls._unbound_fields:
+                cls._unbound_fields = fields
+                cls._wtforms_prototypes = {}
+
+        for subclass in type.__subclasses__(cls):
+            if name not in vars(subclass):
+                subclass._update_unbound_field(name)
+
+
+def _unbound_field_sort_key(field):
+    return field[1].creation_counter, field[0]
 
 
 class Form(BaseForm, metaclass=FormMeta):
@@ -313,12 +616,82 @@ class Form(BaseForm, metaclass=FormMeta):
             prefix=prefix,
         )
 
-        for name, field in self._fields.items():
-            # Set all the fields to attributes so that they obscure the class
-            # attributes with the same names.
-            setattr(self, name, field)
+        if meta_obj.lazy_fields:
+            # Pending fields are looked up through the class attribute holding
+            # their unbound field, see UnboundField.__get__. Fields which are
+            # not reachable that way are bound right away.
+            self._lazy_attributes = {}
+            eager = []
+            for name, field in OrderedDict.items(self._fields):
+                unbound_field = getattr(field, "unbound_field", None)
+                if (
+                    unbound_field is not None
+                    and getattr(self.__class__, name, None) is unbound_field
+                    and unbound_field not in self._lazy_attributes
+                ):
+                    self._lazy_attributes[unbound_field] = name
+                else:
+                    eager.append(name)
+            for name in eager:
+                setattr(self, name, self._fields[name])
+        else:
+            for name, field in self._fields.items():
+                # Set all the fields to attributes so that they obscure the
+                # class attributes with the same names.
+                setattr(self, name, field)
         self.process(formdata, obj, data=data, **kwargs)
 
+    def _resolve_unbound_field(self, unbound_field):
+        """Return the bound field for a class attribute left pending by
+        :attr:`~wtforms.meta.DefaultMeta.lazy_fields`."""
+        name = self.__dict__.get("_lazy_attributes", {}).pop(unbound_field, None)
+        if name is None or name not in self._fields:
+            return unbound_field
+        field = self._fields[name]
+        setattr(self, name, field)
+        return field
+
+    def _bind_field(self, name, unbound_field, options):
+        """Bind a declared field, cloning it from the class prototype when
+        :attr:`~wtforms.meta.DefaultMeta.field_prototypes` is enabled.
+
+        Prototypes are bound once per form class, prefix and locales, then
+        detached from the form that built them. Fields which are not declared
+        on the class, such as the CSRF token field, are always bound, and so
+        are all fields when :meth:`~wtforms.meta.DefaultMeta.get_translations`
+        is overridden, as the translations may then depend on the request.
+        """
+        meta = self.meta
+        if (
+            not meta.field_prototypes
+            or type(meta).get_translations is not DefaultMeta.get_translations
+        ):
+            return super()._bind_field(name, unbound_field, options)
+
+        locales = meta.locales
+        if locales:
+            locales = tuple(locales)
+        key = (options["prefix"], locales)
+        cls = self.__class__
+        prototypes = cls._wtforms_prototypes.get(key)
+        if prototypes is None:
+            if len(cls._wtforms_prototypes) >= _MAX_PROTOTYPE_SETS:
+                return super()._bind_field(name, unbound_field, options)
+            prototypes = cls._wtforms_prototypes.setdefault(key, {})
+
+        entry = prototypes.get(name)
+        if entry is None or entry[0] is not unbound_field:
+            if dict(cls._unbound_fields).get(name) is not unbound_field:
+                return super()._bind_field(name, unbound_field, options)
+            prototype = super()._bind_field(name, unbound_field, options)
+            field = prototype._clone(self, options["translations"])
+            prototype._form = None
+            prototype.meta = None
+            prototypes[name] = (unbound_field, prototype)
+            return field
+
+        return entry[1]._clone(self, options["translations"])
+
     def __setitem__(self, name, value):
         raise TypeError("Fields may not be added to Form instances, only classes.")
 
@@ -350,6 +723,21 @@ class Form(BaseForm, metaclass=FormMeta):
             validators passed when creating the field. If the form has
             ``validate_<fieldname>``, it is the last extra validator.
         """
+        return super().validate(self._with_inline_validators(extra_validators))
+
+    async def validate_async(self, extra_validators=None):
+        """Validate the form like :meth:`validate`, awaiting asynchronous
+        validators, see :meth:`BaseForm.validate_async`.
+
+        ``validate_<fieldname>`` methods may be ``async def`` coroutines.
+        """
+        if type(self).validate is not Form.validate:
+            return self.validate(extra_validators)
+        extra_validators = self._with_inline_validators(extra_validators)
+        return await self._validate_fields_async(extra_validators)
+
+    def _with_inline_validators(self, extra_validators):
+        """Add the ``validate_<fieldname>`` methods to ``extra_validators``."""
         if extra_validators is not None:
             extra = extra_validators.copy()
         else:
@@ -358,6 +746,6 @@ class Form(BaseForm, metaclass=FormMeta):
         for name in self._fields:
             inline = getattr(self.__class__, f"validate_{name}", None)
             if inline is not None:
-                extra.setdefault(name, []).append(inline)
+                extra[name] = [*extra.get(name, ()), inline]
 
-        return super().validate(extra)
+        return extra
@@ -1,6 +1,17 @@
 from wtforms import i18n
 from wtforms.utils import WebobInputWrapper
-from wtforms.widgets.core import clean_key
+from wtforms.widgets.core import _clean_key
+from wtforms.widgets.core import _iter_html
+
+
+def _merge_render_kw(field, render_kw):
+    render_kw = {_clean_key(k): v for k, v in render_kw.items()}
+
+    other_kw = getattr(field, "render_kw", None)
+    if other_kw is not None:
+        other_kw = {_clean_key(k): v for k, v in other_kw.items()}
+        render_kw = dict(other_kw, **render_kw)
+    return render_kw
 
 
 class DefaultMeta:
@@ -55,14 +66,33 @@ class DefaultMeta:
         The default implementation calls ``field.widget(field, **render_kw)``
         """
 
-        render_kw = {clean_key(k): v for k, v in render_kw.items()}
-
-        other_kw = getattr(field, "render_kw", None)
-        if other_kw is not None:
-            other_kw = {clean_key(k): v for k, v in other_kw.items()}
-            render_kw = dict(other_kw, **render_kw)
+        render_kw = _merge_render_kw(field, render_kw)
         return field.widget(field, **render_kw)
 
+    def render_field_iter(self, field, render_kw):
+        """
+        render_field_iter renders a field like :meth:`render_field`, yielding
+        its HTML in chunks.
+
+        The default implementation yields the chunks of the widget's
+        ``render_iter`` method, for widgets which have one, else the whole
+        HTML of :meth:`render_field` at once.
+        """
+        if type(self).render_field is not DefaultMeta.render_field:
+            yield from _iter_html(self.render_field, field, render_kw)
+            return
+        render_kw = _merge_render_kw(field, render_kw)
+        yield from _iter_html(field.widget, field, **render_kw)
+
+    # -- Binding
+
+    field_prototypes = False
+    lazy_fields = False
+
+    # -- Validation
+
+    cheap_validators_first = False
+
     # -- CSRF
 
     csrf = False
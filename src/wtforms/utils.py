@@ -1,5 +1,7 @@
+import contextvars
 import os
 import re
+from bisect import bisect_left
 
 _LEADING_SYMBOL = "#" if os.name == "nt" else "-"
 
@@ -89,3 +91,92 @@ class WebobInputWrapper:
 
     def getlist(self, name):
         return self._wrapped.getall(name)
+
+
+class DictInputWrapper:
+    """
+    Wrap a plain mapping of names to values for use as `formdata`.
+
+    A value which is a list or tuple provides all the values for its name,
+    `None` provides none, and any other value is a single value. This is
+    meant for records coming from sources such as CSV or JSON rather than
+    from an HTTP request.
+    """
+
+    def __init__(self, mapping):
+        self._wrapped = mapping
+
+    def __iter__(self):
+        return iter(self._wrapped)
+
+    def __len__(self):
+        return len(self._wrapped)
+
+    def __contains__(self, name):
+        return name in self._wrapped
+
+    def getlist(self, name):
+        value = self._wrapped[name]
+        if value is None:
+            return []
+        if isinstance(value, list | tuple):
+            return list(value)
+        return [value]
+
+
+class _FormdataIndex:
+    """
+    The keys of the formdata being processed, sorted on first use so the keys
+    starting with a prefix can be found without scanning all of them.
+    """
+
+    __slots__ = ("formdata", "_keys")
+
+    def __init__(self, formdata):
+        self.formdata = formdata
+        self._keys = None
+
+    def keys_with_prefix(self, prefix):
+        keys = self._keys
+        if keys is None:
+            try:
+                keys = self._keys = sorted(self.formdata)
+            except TypeError:
+                # Keys which are not all strings can't be sorted together.
+                keys = self._keys = ()
+        if not keys:
+            return None
+        matches = []
+        for i in range(bisect_left(keys, prefix), len(keys)):
+            key = keys[i]
+            if not key.startswith(prefix):
+                break
+            matches.append(key)
+        return matches
+
+
+_formdata_index = contextvars.ContextVar("wtforms_formdata_index", default=None)
+
+
+def _index_formdata(formdata):
+    """
+    Let :func:`_keys_with_prefix` use an index of the keys of ``formdata``,
+    such as while a form processes it. Return a token to pass to
+    ``_formdata_index.reset`` once done, or `None` if there is nothing to do.
+    """
+    if not formdata:
+        return None
+    index = _formdata_index.get()
+    if index is not None and index.formdata is formdata:
+        return None
+    return _formdata_index.set(_FormdataIndex(formdata))
+
+
+def _keys_with_prefix(formdata, prefix):
+    """Return the keys of ``formdata`` starting with ``prefix``."""
+    index = _formdata_index.get()
+    if index is not None and index.formdata is formdata:
+        keys = index.keys_with_prefix(prefix)
+        if keys is not None:
+            return keys
+    return [k for k in formdata if k.startswith(prefix)]
@@ -1,12 +1,15 @@
+import functools
 import ipaddress
 import math
 import re
+import threading
 import uuid
+from collections import OrderedDict
 from collections.abc import Callable
 from datetime import date
 from datetime import datetime
 from datetime import time
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 __all__ = (
     "DataRequired",
@@ -44,6 +47,8 @@ __all__ = (
     "ReadOnly",
     "disabled",
     "Disabled",
+    "validate_column",
+    "ValidatorCache",
 )
 
 
@@ -69,6 +74,150 @@ class StopValidation(Exception):
         Exception.__init__(self, message, *args, **kwargs)
 
 
+class ValidatorCache:
+    """
+    A bounded, thread-safe cache of validation results, shared by the pure
+    validators it is given to with their ``cache`` argument.
+
+    Results are keyed by the configuration of the validator and the
+    validated value, so validators configured differently can share a cache.
+    Error messages are not cached but built from the cached result, in the
+    language of each field. The least recently used results are dropped
+    once ``maxsize`` are stored.
+
+    :param maxsize:
+        The maximum number of results to keep.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        #: The number of results found in the cache.
+        self.hits = 0
+        #: The number of results computed because they were not cached.
+        self.misses = 0
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, compute, value):
+        """Return the result for ``key``, calling ``compute(value)`` to
+        compute and store it if it is not cached."""
+        with self._lock:
+            try:
+                result = self._results[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return result
+
+        result = compute(value)
+        with self._lock:
+            self._results[key] = result
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+        return result
+
+    def clear(self):
+        """Drop all results and reset the counters."""
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._results)
+
+
+def _cached_check(validator, value):
+    """Call ``validator._check(value)``, going through the validator's
+    :class:`ValidatorCache` if it has one and is pure."""
+    cache = validator.cache
+    if cache is None or not validator.pure:
+        return validator._check(value)
+    key = (validator._cache_key(), value)
+    try:
+        hash(key)
+    except TypeError:
+        return validator._check(value)
+    return cache.get(key, validator._check, value)
+
+
+def validate_column(validator, form, field, values):
+    """
+    Run ``validator`` against a column of values for ``field``, returning a
+    list holding, for each value, `None` if it is valid or the error message.
+
+    Validators providing a ``validate_column(form, field, values)`` method
+    with the same return value are called once for the whole column, unless a
+    subclass overrides ``__call__`` without overriding ``validate_column``.
+    Other validators are called once per value, with the value set as the
+    field's ``data``; the field's ``data`` and ``errors`` are restored
+    afterwards.
+    """
+    if _has_column_protocol(type(validator)):
+        return validator.validate_column(form, field, values)
+
+    results = []
+    data, errors = field.data, field.errors
+    try:
+        for value in values:
+            field.data = value
+            field.errors = []
+            try:
+                validator(form, field)
+            except StopValidation as e:
+                results.append(e.args[0] if e.args and e.args[0] else None)
+            except ValidationError as e:
+                results.append(e.args[0])
+            else:
+                results.append(None)
+    finally:
+        field.data, field.errors = data, errors
+    return results
+
+
+@functools.cache
+def _has_column_protocol(cls):
+    for klass in cls.__mro__:
+        if "validate_column" in vars(klass):
+            return True
+        if "__call__" in vars(klass):
+            return False
+    return False
+
+
+@functools.cache
+def _email_validator():
+    try:
+        import email_validator
+    except ImportError as exc:  # pragma: no cover
+        raise Exception(
+            "Install 'email_validator' for email validation support."
+        ) from exc
+    return email_validator
+
+
+@functools.cache
+def _numpy():
+    """Return the numpy module if it is installed, used to validate columns of
+    numbers."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _column_results(size, invalid, message):
+    """Build a :func:`validate_column` result from the indices of the
+    invalid values, calling ``message(index)`` for each of them."""
+    results = [None] * size
+    for index in invalid:
+        results[index] = message(index)
+    return results
+
+
 class EqualTo:
     """
     Compares the values of two fields.
@@ -81,6 +230,8 @@ class EqualTo:
         more helpful error.
     """
 
+    cost = 1
+
     def __init__(self, fieldname, message=None):
         self.fieldname = fieldname
         self.message = message
@@ -126,6 +277,8 @@ class Length:
     When supported, sets the `minlength` and `maxlength` attributes on widgets.
     """
 
+    cost = 1
+
     def __init__(self, min=-1, max=-1, message=None):
         assert min != -1 or max != -1, (
             "At least one of `min` or `max` must be specified."
@@ -145,6 +298,36 @@ class Length:
         if length >= self.min and (self.max == -1 or length <= self.max):
             return
 
+        raise ValidationError(self._message(field, length))
+
+    def validate_column(self, form, field, values):
+        """Validate a column of values, see :func:`validate_column`."""
+        lengths = [value and len(value) or 0 for value in values]
+        np = _numpy()
+        if np is not None and lengths:
+            array = np.array(lengths)
+            invalid = array < self.min
+            if self.max != -1:
+                invalid |= array > self.max
+            invalid = np.flatnonzero(invalid).tolist()
+        else:
+            invalid = [
+                index
+                for index, length in enumerate(lengths)
+                if length < self.min or (self.max != -1 and length > self.max)
+            ]
+
+        messages = {}
+
+        def message(index):
+            length = lengths[index]
+            if length not in messages:
+                messages[length] = self._message(field, length)
+            return messages[length]
+
+        return _column_results(len(lengths), invalid, message)
+
+    def _message(self, field, length):
         if self.message is not None:
             message = self.message
 
@@ -171,7 +354,7 @@ class Length:
                 "Field must be between %(min)d and %(max)d characters long."
             )
 
-        raise ValidationError(message % dict(min=self.min, max=self.max, length=length))
+        return message % dict(min=self.min, max=self.max, length=length)
 
 
 class NumberRange:
@@ -198,6 +381,8 @@ class NumberRange:
     When supported, sets the `min` and `max` attributes on widgets.
     """
 
+    cost = 1
+
     def __init__(self, min=None, max=None, message=None):
         self.min = min
         self.max = max
@@ -224,6 +409,50 @@ class NumberRange:
         ):
             return
 
+        raise ValidationError(self._message(field, min_value, max_value))
+
+    def validate_column(self, form, field, values):
+        """Validate a column of numbers, see :func:`validate_column`.
+
+        Numpy arrays of integers or floats are compared as arrays, when the
+        bounds are integers or floats too.
+        """
+        min_value = self._resolve(self.min)
+        max_value = self._resolve(self.max)
+        np = _numpy()
+        if (
+            np is not None
+            and isinstance(values, np.ndarray)
+            and values.ndim == 1
+            and values.dtype.kind in "biuf"
+            and all(
+                bound is None or type(bound) in (int, float)
+                for bound in (min_value, max_value)
+            )
+        ):
+            if values.dtype.kind == "f":
+                invalid = np.isnan(values)
+            else:
+                invalid = np.zeros(len(values), dtype=bool)
+            if min_value is not None:
+                invalid |= values < min_value
+            if max_value is not None:
+                invalid |= values > max_value
+            invalid = np.flatnonzero(invalid).tolist()
+        else:
+            invalid = [
+                index
+                for index, data in enumerate(values)
+                if data is None
+                or math.isnan(data)
+                or (min_value is not None and data < min_value)
+                or (max_value is not None and data > max_value)
+            ]
+
+        message = invalid and self._message(field, min_value, max_value)
+        return _column_results(len(values), invalid, lambda index: message)
+
+    def _message(self, field, min_value, max_value):
         if self.message is not None:
             message = self.message
 
@@ -238,7 +467,7 @@ class NumberRange:
         else:
             message = field.gettext("Number must be between %(min)s and %(max)s.")
 
-        raise ValidationError(message % dict(min=min_value, max=max_value))
+        return message % dict(min=min_value, max=max_value)
 
 
 class DateRange:
@@ -280,6 +509,8 @@ class DateRange:
     When supported, sets the `min` and `max` attributes on widgets.
     """
 
+    cost = 1
+
     def __init__(
         self,
         min=None,
@@ -401,13 +632,23 @@ class DataRequired:
         if field.data and (not isinstance(field.data, str) or field.data.strip()):
             return
 
-        if self.message is None:
-            message = field.gettext("This field is required.")
-        else:
-            message = self.message
-
         field.errors[:] = []
-        raise StopValidation(message)
+        raise StopValidation(self._message(field))
+
+    def validate_column(self, form, field, values):
+        """Validate a column of values, see :func:`validate_column`."""
+        invalid = [
+            index
+            for index, data in enumerate(values)
+            if not data or (isinstance(data, str) and not data.strip())
+        ]
+        message = invalid and self._message(field)
+        return _column_results(len(values), invalid, lambda index: message)
+
+    def _message(self, field):
+        if self.message is None:
+            return field.gettext("This field is required.")
+        return self.message
 
 
 class InputRequired:
@@ -431,13 +672,27 @@ class InputRequired:
         if field.raw_data and field.raw_data[0]:
             return
 
-        if self.message is None:
-            message = field.gettext("This field is required.")
-        else:
-            message = self.message
-
         field.errors[:] = []
-        raise StopValidation(message)
+        raise StopValidation(self._message(field))
+
+    def validate_column(self, form, field, values):
+        """Validate a column of ``raw_data`` lists, see :func:`validate_column`.
+
+        Unlike other validators, this checks the input values, so the column
+        holds the ``raw_data`` of each row rather than its ``data``.
+        """
+        invalid = [
+            index
+            for index, raw_data in enumerate(values)
+            if not raw_data or not raw_data[0]
+        ]
+        message = invalid and self._message(field)
+        return _column_results(len(values), invalid, lambda index: message)
+
+    def _message(self, field):
+        if self.message is None:
+            return field.gettext("This field is required.")
+        return self.message
 
 
 class Regexp:
@@ -470,6 +725,8 @@ class Regexp:
         the browser.
     """
 
+    cost = 2
+
     def __init__(
         self,
         regex,
@@ -500,13 +757,24 @@ class Regexp:
             return match
 
         if message is None:
-            if self.message is None:
-                message = field.gettext("Invalid input.")
-            else:
-                message = self.message
+            message = self._message(field)
 
         raise ValidationError(message)
 
+    def validate_column(self, form, field, values):
+        """Validate a column of values, see :func:`validate_column`."""
+        matcher, regex = self.matcher, self.regex
+        invalid = [
+            index for index, data in enumerate(values) if not matcher(regex, data or "")
+        ]
+        message = invalid and self._message(field)
+        return _column_results(len(values), invalid, lambda index: message)
+
+    def _message(self, field):
+        if self.message is None:
+            return field.gettext("Invalid input.")
+        return self.message
+
 
 class Email:
     """
@@ -536,8 +804,15 @@ class Email:
     :param allow_empty_local:
         Allow an empty local part (i.e. @example.com), e.g. for validating
         Postfix aliases (Default: defer to ``email_validator``).
+    :param cache:
+        A :class:`ValidatorCache` to remember the results in. It is not used
+        when ``check_deliverability`` is enabled, as the result then depends
+        on the DNS.
     """
 
+    cost = 5
+    pure = True
+
     def __init__(
         self,
         message=None,
@@ -546,40 +821,92 @@ class Email:
         test_environment=None,
         allow_smtputf8=None,
         allow_empty_local=None,
+        cache=None,
     ):
         self.message = message
         self.granular_message = granular_message
         self.check_deliverability = check_deliverability
+        if check_deliverability:
+            # Resolving the domain is far slower than any local check, and
+            # its result may change over time.
+            self.cost = 100
+            self.pure = False
         self.test_environment = test_environment
         self.allow_smtputf8 = allow_smtputf8
         self.allow_empty_local = allow_empty_local
+        self.cache = cache
+
+    # A syntactic check run before email_validator, only rejecting addresses
+    # which email_validator would reject whatever its options: no domain, or
+    # ASCII domains and unquoted ASCII local parts with invalid characters or
+    # misplaced periods. Anything else, such as internationalized addresses,
+    # quoted local parts or domain literals, is left to email_validator.
+    _local_part = re.compile(
+        r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+)*\Z"
+    )
+    _domain_part = re.compile(r"[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\Z")
+
+    @classmethod
+    def _is_plausible(cls, value):
+        local, at, domain = value.rpartition("@")
+        if not at or not domain:
+            return False
+        if domain.isascii() and domain[0] != "[" and not cls._domain_part.match(domain):
+            return False
+        return not (
+            local
+            and local.isascii()
+            and local[0] != '"'
+            and not cls._local_part.match(local)
+        )
 
     def __call__(self, form, field):
-        try:
-            import email_validator
-        except ImportError as exc:  # pragma: no cover
-            raise Exception(
-                "Install 'email_validator' for email validation support."
-            ) from exc
+        value = field.data
+        if (
+            not self.granular_message
+            and type(value) is str
+            and not self._is_plausible(value)
+        ):
+            reason = ""
+        else:
+            reason = _cached_check(self, value)
+        if reason is None:
+            return
 
+        message = self.message
+        if message is None:
+            if self.granular_message:
+                message = field.gettext(reason)
+            else:
+                message = field.gettext("Invalid email address.")
+        raise ValidationError(message)
+
+    def _cache_key(self):
+        return (
+            Email,
+            self.check_deliverability,
+            self.test_environment,
+            self.allow_smtputf8,
+            self.allow_empty_local,
+        )
+
+    def _check(self, value):
+        """Return `None` if ``value`` is a valid address, or the reason given
+        by ``email_validator`` otherwise."""
+        email_validator = _email_validator()
         try:
-            if field.data is None:
+            if value is None:
                 raise email_validator.EmailNotValidError()
             email_validator.validate_email(
-                field.data,
+                value,
                 check_deliverability=self.check_deliverability,
                 test_environment=self.test_environment,
                 allow_smtputf8=self.allow_smtputf8,
                 allow_empty_local=self.allow_empty_local,
             )
         except email_validator.EmailNotValidError as e:
-            message = self.message
-            if message is None:
-                if self.granular_message:
-                    message = field.gettext(e)
-                else:
-                    message = field.gettext("Invalid email address.")
-            raise ValidationError(message) from e
+            return str(e)
+        return None
 
 
 class IPAddress:
@@ -592,9 +919,14 @@ class IPAddress:
         If True, accept IPv6 addresses as valid (default False)
     :param message:
         Error message to raise in case of a validation error.
+    :param cache:
+        A :class:`ValidatorCache` to remember the results in.
     """
 
-    def __init__(self, ipv4=True, ipv6=False, message=None):
+    cost = 2
+    pure = True
+
+    def __init__(self, ipv4=True, ipv6=False, message=None, cache=None):
         if not ipv4 and not ipv6:
             raise ValueError(
                 "IP Address Validator must have at least one of ipv4 or ipv6 enabled."
@@ -602,16 +934,10 @@ class IPAddress:
         self.ipv4 = ipv4
         self.ipv6 = ipv6
         self.message = message
+        self.cache = cache
 
     def __call__(self, form, field):
-        value = field.data
-        valid = False
-        if value:
-            valid = (self.ipv4 and self.check_ipv4(value)) or (
-                self.ipv6 and self.check_ipv6(value)
-            )
-
-        if valid:
+        if _cached_check(self, field.data):
             return
 
         message = self.message
@@ -619,29 +945,34 @@ class IPAddress:
             message = field.gettext("Invalid IP address.")
         raise ValidationError(message)
 
-    @classmethod
-    def check_ipv4(cls, value):
-        try:
-            address = ipaddress.ip_address(value)
-        except ValueError:
-            return False
+    def _cache_key(self):
+        return IPAddress, self.ipv4, self.ipv6
 
-        if not isinstance(address, ipaddress.IPv4Address):
+    def _check(self, value):
+        if not value:
             return False
+        address = self._parse(value)
+        return bool(
+            (self.ipv4 and isinstance(address, ipaddress.IPv4Address))
+            or (self.ipv6 and isinstance(address, ipaddress.IPv6Address))
+        )
 
-        return True
-
-    @classmethod
-    def check_ipv6(cls, value):
+    @staticmethod
+    def _parse(value):
+        """Return the address ``value`` represents, or `None` if it is not
+        an IP address."""
         try:
-            address = ipaddress.ip_address(value)
+            return ipaddress.ip_address(value)
         except ValueError:
-            return False
+            return None
 
-        if not isinstance(address, ipaddress.IPv6Address):
-            return False
+    @classmethod
+    def check_ipv4(cls, value):
+        return isinstance(cls._parse(value), ipaddress.IPv4Address)
 
-        return True
+    @classmethod
+    def check_ipv6(cls, value):
+        return isinstance(cls._parse(value), ipaddress.IPv6Address)
 
 
 class MacAddress(Regexp):
@@ -666,7 +997,7 @@ class MacAddress(Regexp):
 
 class URL:
     """
-    Simple url validation based on :func:`urllib.parse.urlparse`. Much like
+    Simple url validation based on :func:`urllib.parse.urlsplit`. Much like
     the email validator, you probably want to validate the url later by
     other means if the url must resolve.
 
@@ -687,8 +1018,13 @@ class URL:
         ``data:``, etc. would be accepted).
     :param message:
         Error message to raise in case of a validation error.
+    :param cache:
+        A :class:`ValidatorCache` to remember the results in.
     """
 
+    cost = 3
+    pure = True
+
     def __init__(
         self,
         require_tld=True,
@@ -696,40 +1032,57 @@ class URL:
         allow_userinfo=False,
         schemes=("http", "https"),
         message=None,
+        cache=None,
     ):
         self.allow_userinfo = allow_userinfo
         self.schemes = schemes
         self.message = message
+        self.cache = cache
         self.validate_hostname = HostnameValidation(
             require_tld=require_tld, allow_ip=allow_ip
         )
 
     def __call__(self, form, field):
+        if _cached_check(self, field.data):
+            return
+
         message = self.message
         if message is None:
             message = field.gettext("Invalid URL.")
+        raise ValidationError(message)
 
+    def _cache_key(self):
+        schemes = self.schemes
+        if schemes is not None:
+            schemes = frozenset(schemes)
+        return (
+            URL,
+            self.allow_userinfo,
+            schemes,
+            self.validate_hostname.require_tld,
+            self.validate_hostname.allow_ip,
+        )
+
+    def _check(self, value):
         try:
-            r = urlparse(field.data)
-        except ValueError as exc:
-            raise ValidationError(message) from exc
+            r = urlsplit(value)
+            hostname = r.hostname
+            _ = r.port
+        except ValueError:
+            return False
 
-        if not r.scheme or not r.hostname:
-            raise ValidationError(message)
+        if not r.scheme or not hostname:
+            return False
 
         if self.schemes is not None and r.scheme not in self.schemes:
-            raise ValidationError(message)
-
-        if not self.allow_userinfo and (r.username or r.password):
-            raise ValidationError(message)
+            return False
 
-        try:
-            _ = r.port
-        except ValueError as exc:
-            raise ValidationError(message) from exc
+        # Equivalent to checking ``r.username or r.password``, without
+        # splitting the netloc twice more.
+        if not self.allow_userinfo and r.netloc.rpartition("@")[0] not in ("", ":"):
+            return False
 
-        if not self.validate_hostname(r.hostname):
-            raise ValidationError(message)
+        return self.validate_hostname(hostname)
 
 
 class UUID:
@@ -738,26 +1091,101 @@ class UUID:
 
     :param message:
         Error message to raise in case of a validation error.
+    :param cache:
+        A :class:`ValidatorCache` to remember the results in.
     """
 
-    def __init__(self, message=None):
+    cost = 2
+    pure = True
+
+    def __init__(self, message=None, cache=None):
         self.message = message
+        self.cache = cache
 
     def __call__(self, form, field):
+        if isinstance(field.data, uuid.UUID) or _cached_check(self, field.data):
+            return
+
         message = self.message
         if message is None:
             message = field.gettext("Invalid UUID.")
-        if isinstance(field.data, uuid.UUID):
-            return
-        if not isinstance(field.data, str):
-            raise ValidationError(message)
+        raise ValidationError(message)
+
+    def _cache_key(self):
+        return UUID
+
+    def _check(self, value):
+        if not isinstance(value, str):
+            return False
         try:
-            uuid.UUID(field.data)
-        except ValueError as exc:
-            raise ValidationError(message) from exc
+            uuid.UUID(value)
+        except ValueError:
+            return False
+        return True
+
+
+class _Membership:
+    """
+    Base for validators testing the incoming data for membership in a
+    sequence of values.
+
+    Lists and tuples of hashable values are indexed in a frozenset, making
+    each test constant time instead of a scan of the sequence. Data which
+    cannot be hashed, and sequences which cannot be indexed, are tested
+    against the sequence itself. The index is rebuilt when ``values`` is
+    assigned, but not when the sequence is modified in place.
+    """
 
+    cost = 1
 
-class AnyOf:
+    def __init__(self, values, message=None, values_formatter=None):
+        self.values = values
+        self.message = message
+        if values_formatter is None:
+            values_formatter = self.default_values_formatter
+        self.values_formatter = values_formatter
+
+    @property
+    def values(self):
+        return self._values
+
+    @values.setter
+    def values(self, values):
+        self._values = values
+        self._index = None
+        self._formatted = None
+        if type(values) in (list, tuple):
+            try:
+                self._index = frozenset(values)
+            except TypeError:
+                pass
+
+    def _contains(self, data):
+        if self._index is not None:
+            try:
+                return data in self._index
+            except TypeError:
+                pass
+        return data in self._values
+
+    def _any_contained(self, data):
+        if not isinstance(data, list):
+            return self._contains(data)
+        return any(self._contains(d) for d in data)
+
+    def _formatted_values(self):
+        # Only needed for error messages, so formatted on the first failure
+        # and then kept, for as long as the values and formatter stay the same.
+        formatted = self._formatted
+        if formatted is None or formatted[0] is not self.values_formatter:
+            formatted = self._formatted = (
+                self.values_formatter,
+                self.values_formatter(self._values),
+            )
+        return formatted[1]
+
+
+class AnyOf(_Membership):
     """
     Compares the incoming data to a sequence of valid inputs.
 
@@ -770,30 +1198,32 @@ class AnyOf:
         Function used to format the list of values in the error message.
     """
 
-    def __init__(self, values, message=None, values_formatter=None):
-        self.values = values
-        self.message = message
-        if values_formatter is None:
-            values_formatter = self.default_values_formatter
-        self.values_formatter = values_formatter
-
     def __call__(self, form, field):
-        data = field.data if isinstance(field.data, list) else [field.data]
-        if any(d in self.values for d in data):
+        if self._any_contained(field.data):
             return
 
+        raise ValidationError(self._message(field))
+
+    def validate_column(self, form, field, values):
+        """Validate a column of values, see :func:`validate_column`."""
+        invalid = [
+            index for index, data in enumerate(values) if not self._any_contained(data)
+        ]
+        message = invalid and self._message(field)
+        return _column_results(len(values), invalid, lambda index: message)
+
+    def _message(self, field):
         message = self.message
         if message is None:
             message = field.gettext("Invalid value, must be one of: %(values)s.")
-
-        raise ValidationError(message % dict(values=self.values_formatter(self.values)))
+        return message % dict(values=self._formatted_values())
 
     @staticmethod
     def default_values_formatter(values):
         return ", ".join(str(x) for x in values)
 
 
-class NoneOf:
+class NoneOf(_Membership):
     """
     Compares the incoming data to a sequence of invalid inputs.
 
@@ -806,23 +1236,25 @@ class NoneOf:
         Function used to format the list of values in the error message.
     """
 
-    def __init__(self, values, message=None, values_formatter=None):
-        self.values = values
-        self.message = message
-        if values_formatter is None:
-            values_formatter = self.default_values_formatter
-        self.values_formatter = values_formatter
-
     def __call__(self, form, field):
-        data = field.data if isinstance(field.data, list) else [field.data]
-        if not any(d in self.values for d in data):
+        if not self._any_contained(field.data):
             return
 
+        raise ValidationError(self._message(field))
+
+    def validate_column(self, form, field, values):
+        """Validate a column of values, see :func:`validate_column`."""
+        invalid = [
+            index for index, data in enumerate(values) if self._any_contained(data)
+        ]
+        message = invalid and self._message(field)
+        return _column_results(len(values), invalid, lambda index: message)
+
+    def _message(self, field):
         message = self.message
         if message is None:
             message = field.gettext("Invalid value, can't be any of: %(values)s.")
-
-        raise ValidationError(message % dict(values=self.values_formatter(self.values)))
+        return message % dict(values=self._formatted_values())
 
     @staticmethod
     def default_values_formatter(v):
@@ -839,30 +1271,57 @@ class HostnameValidation:
     hostname_part = re.compile(r"^(xn-|[a-z0-9_]+)(-[a-z0-9_-]+)*$", re.IGNORECASE)
     tld_part = re.compile(r"^([a-z]{2,20}|xn--([a-z0-9]+-)*[a-z0-9]+)$", re.IGNORECASE)
 
-    def __init__(self, require_tld=True, allow_ip=False):
+    # ``hostname_part`` and ``tld_part`` folded into patterns matching a whole
+    # hostname at once, each label being checked for its length by a
+    # lookahead. Unlike ``$``, ``\Z`` does not match before a trailing newline.
+    _label = r"(?=[^.]{1,63}(?:\.|\Z))(?:[a-z0-9_]+(?:-[a-z0-9_-]+)?|xn-)"
+    _hostname = re.compile(rf"(?:{_label}\.)*{_label}\Z", re.IGNORECASE)
+    _tld_hostname = re.compile(
+        rf"(?:{_label}\.)+(?=[^.]{{1,63}}\Z)"
+        r"(?:[a-z]{2,20}|xn--(?:[a-z0-9]+-)*[a-z0-9]+)\Z",
+        re.IGNORECASE,
+    )
+
+    pure = True
+
+    def __init__(self, require_tld=True, allow_ip=False, cache=None):
         self.require_tld = require_tld
         self.allow_ip = allow_ip
+        self.cache = cache
 
     def __call__(self, hostname):
-        if self.allow_ip and (
-            IPAddress.check_ipv4(hostname) or IPAddress.check_ipv6(hostname)
-        ):
+        return _cached_check(self, hostname)
+
+    def _cache_key(self):
+        return HostnameValidation, self.require_tld, self.allow_ip
+
+    def _check(self, hostname):
+        if self.allow_ip and IPAddress._parse(hostname) is not None:
             return True
 
         # Encode out IDNA hostnames. This makes further validation easier.
-        try:
-            hostname = hostname.encode("idna")
-        except UnicodeError:
-            pass
-
-        # Turn back into a string in Python 3x
-        if not isinstance(hostname, str):
-            hostname = hostname.decode("ascii")
+        # ASCII hostnames are left unchanged by the codec.
+        if not hostname.isascii():
+            try:
+                hostname = hostname.encode("idna").decode("ascii")
+            except UnicodeError:
+                pass
 
         if len(hostname) > 253:
             return False
 
-        # Check that all labels in the hostname are valid
+        if (
+            type(self).hostname_part is not HostnameValidation.hostname_part
+            or type(self).tld_part is not HostnameValidation.tld_part
+        ):
+            return self._check_labels(hostname)
+
+        pattern = self._tld_hostname if self.require_tld else self._hostname
+        return pattern.match(hostname) is not None
+
+    def _check_labels(self, hostname):
+        # Checks each label on its own, honoring ``hostname_part`` and
+        # ``tld_part`` when a subclass overrides them.
         parts = hostname.split(".")
         for part in parts:
             if not part or len(part) > 63:
@@ -884,6 +1343,8 @@ class ReadOnly:
     field object data, or if unset, from the field default data.
     """
 
+    cost = 1
+
     def __init__(self):
         self.field_flags = {"readonly": True}
 
@@ -899,6 +1360,8 @@ class Disabled:
     Validation fails if the form data has any value.
     """
 
+    cost = 1
+
     def __init__(self):
         self.field_flags = {"disabled": True}
 
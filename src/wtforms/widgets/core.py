@@ -43,6 +43,36 @@ def clean_key(key):
     return key
 
 
+# Keyword arguments seen by html_params and render_field are mostly the same
+# few attribute names, so their cleaned and escaped forms are kept, up to a
+# bound in case keys come from data.
+_KEY_CACHE_SIZE = 1024
+_clean_keys = {}
+_html_keys = {}
+
+
+def _clean_key(key):
+    """:func:`clean_key`, remembering the result."""
+    try:
+        return _clean_keys[key]
+    except KeyError:
+        cleaned = clean_key(key)
+        if len(_clean_keys) < _KEY_CACHE_SIZE:
+            _clean_keys[key] = cleaned
+        return cleaned
+
+
+def _html_key(key):
+    """Return ``key`` cleaned and escaped, as written in an HTML tag."""
+    try:
+        return _html_keys[key]
+    except KeyError:
+        html_key = str(escape(_clean_key(key)))
+        if len(_html_keys) < _KEY_CACHE_SIZE:
+            _html_keys[key] = html_key
+        return html_key
+
+
 def html_params(**kwargs):
     """
     Generate HTML attribute syntax from inputted keyword arguments.
@@ -79,15 +109,99 @@ def html_params(**kwargs):
     """
     params = []
     for k, v in sorted(kwargs.items()):
-        k = clean_key(k)
+        if v is False:
+            continue
+        k = _html_key(k)
         if v is True:
             params.append(k)
-        elif v is False:
-            pass
+        elif type(v) is str:
+            # Escaping a str also escapes its double quotes.
+            params.append(f'{k}="{escape(v)}"')
         else:
             v = escape(v).replace(Markup('"'), Markup("&quot;"))
-            params.append(Markup('{k}="{v}"').format(k=k, v=v))
-    return Markup(" ").join(params)
+            params.append(f'{k}="{v}"')
+    return Markup(" ".join(params))
+
+
+# A widget renders the same attributes for a field every time apart from its
+# value, so the attributes sorting before and after ``value`` are serialized
+# once per widget, for attribute values of these types.
+_FRAGMENT_CACHE_SIZE = 256
+_FRAGMENT_TYPES = frozenset((str, Markup, int, float, bool, type(None)))
+_unset = object()
+
+
+def _render_params(widget, name, kwargs):
+    """
+    Return ``widget.html_params(name=name, **kwargs)``, reusing the
+    serialized attributes of an earlier call which only differed by its
+    ``value``.
+    """
+    render = getattr(widget, "html_params", html_params)
+    if render is not html_params or "name" in kwargs:
+        return render(name=name, **kwargs)
+
+    value = kwargs.pop("value", _unset)
+    key = [name]
+    for k, v in kwargs.items():
+        if v.__class__ not in _FRAGMENT_TYPES:
+            if value is not _unset:
+                kwargs["value"] = value
+            return html_params(name=name, **kwargs)
+        key += (k, v.__class__, v)
+    key = tuple(key)
+
+    try:
+        cache = widget._fragments
+    except AttributeError:
+        cache = widget._fragments = {}
+    try:
+        before, after = cache[key]
+    except KeyError:
+        kwargs["name"] = name
+        before = html_params(**{k: v for k, v in kwargs.items() if k < "value"})
+        after = html_params(**{k: v for k, v in kwargs.items() if k > "value"})
+        if len(cache) >= _FRAGMENT_CACHE_SIZE:
+            cache.clear()
+        cache[key] = before, after
+
+    if value is _unset:
+        params = (before, after)
+    else:
+        params = (before, html_params(value=value), after)
+    return Markup(" ".join([p for p in params if p]))
+
+
+def _flag_names(flags, names):
+    """Return which of ``names`` are set on ``flags``, as listed by :func:`dir`."""
+    cls = type(flags)
+    if cls.__dir__ is object.__dir__ and hasattr(flags, "__dict__"):
+        attrs = flags.__dict__
+        return [k for k in names if k in attrs or hasattr(cls, k)]
+    return [k for k in dir(flags) if k in names]
+
+
+def _render_iter(obj):
+    """
+    Return the ``render_iter`` method of ``obj`` if it yields the HTML
+    returned by calling ``obj``, that is if ``render_iter`` is defined along
+    with the ``__call__`` method used, else `None`.
+    """
+    for cls in type(obj).__mro__:
+        attrs = vars(cls)
+        if "__call__" in attrs:
+            return obj.render_iter if "render_iter" in attrs else None
+    return None
+
+
+def _iter_html(obj, *args, **kwargs):
+    """Yield the HTML of ``obj(*args, **kwargs)``, in chunks if ``obj`` can."""
+    render_iter = _render_iter(obj)
+    if render_iter is None:
+        html = obj(*args, **kwargs)
+        yield html if isinstance(html, Markup) else Markup(html)
+    else:
+        yield from render_iter(*args, **kwargs)
 
 
 class ListWidget:
@@ -119,6 +233,21 @@ class ListWidget:
         html.append(f"</{self.html_tag}>")
         return Markup("".join(html))
 
+    def render_iter(self, field, **kwargs):
+        """Yield the HTML of the list in chunks, one subfield at a time."""
+        kwargs.setdefault("id", field.id)
+        yield Markup(f"<{self.html_tag} {html_params(**kwargs)}>")
+        for subfield in field:
+            if self.prefix_label:
+                yield Markup(f"<li>{subfield.label} ")
+                yield from _iter_html(subfield)
+                yield Markup("</li>")
+            else:
+                yield Markup("<li>")
+                yield from _iter_html(subfield)
+                yield Markup(f" {subfield.label}</li>")
+        yield Markup(f"</{self.html_tag}>")
+
 
 class TableWidget:
     """
@@ -141,21 +270,39 @@ class TableWidget:
             kwargs.setdefault("id", field.id)
             table_params = html_params(**kwargs)
             html.append(f"<table {table_params}>")
-        hidden = ""
+        hidden = []
         for subfield in field:
             if subfield.type in ("HiddenField", "CSRFTokenField"):
-                hidden += str(subfield)
+                hidden.append(str(subfield))
             else:
-                html.append(
-                    f"<tr><th>{subfield.label}</th><td>{hidden}{subfield}</td></tr>"
-                )
-                hidden = ""
+                html.append(f"<tr><th>{subfield.label}</th><td>")
+                html.extend(hidden)
+                html.append(f"{subfield}</td></tr>")
+                hidden = []
         if self.with_table_tag:
             html.append("</table>")
-        if hidden:
-            html.append(hidden)
+        html.extend(hidden)
         return Markup("".join(html))
 
+    def render_iter(self, field, **kwargs):
+        """Yield the HTML of the table in chunks, one row at a time."""
+        if self.with_table_tag:
+            kwargs.setdefault("id", field.id)
+            yield Markup(f"<table {html_params(**kwargs)}>")
+        hidden = []
+        for subfield in field:
+            if subfield.type in ("HiddenField", "CSRFTokenField"):
+                hidden.extend(_iter_html(subfield))
+            else:
+                yield Markup(f"<tr><th>{subfield.label}</th><td>")
+                yield from hidden
+                yield from _iter_html(subfield)
+                yield Markup("</td></tr>")
+                hidden = []
+        if self.with_table_tag:
+            yield Markup("</table>")
+        yield from hidden
+
 
 class DataListWidget:
     """
@@ -170,8 +317,8 @@ class DataListWidget:
     """
 
     def __call__(self, datalist, field=None, **kwargs):
-        render_kw = {clean_key(k): v for k, v in datalist.render_kw.items()}
-        kwargs = {clean_key(k): v for k, v in kwargs.items()}
+        render_kw = {_clean_key(k): v for k, v in datalist.render_kw.items()}
+        kwargs = {_clean_key(k): v for k, v in kwargs.items()}
         attrs = {**render_kw, "id": datalist.id, **kwargs}
         options = []
         for choice in datalist.iter_choices(field):
@@ -209,11 +356,11 @@ class Input:
         if datalist is not None and "list" not in kwargs:
             kwargs["list"] = datalist if isinstance(datalist, str) else datalist.id
         flags = getattr(field, "flags", {})
-        for k in dir(flags):
-            if k in self.validation_attrs and k not in kwargs:
+        for k in _flag_names(flags, self.validation_attrs):
+            if k not in kwargs:
                 value = getattr(flags, k)
                 kwargs[k] = value() if callable(value) else value
-        input_params = self.html_params(name=field.name, **kwargs)
+        input_params = _render_params(self, field.name, kwargs)
         return Markup(f"<input {input_params}>")
 
 
@@ -240,10 +387,10 @@ class Button:
         kwargs.setdefault("type", self.input_type)
         kwargs.setdefault("value", field._value())
         flags = getattr(field, "flags", {})
-        for k in dir(flags):
-            if k in self.validation_attrs and k not in kwargs:
+        for k in _flag_names(flags, self.validation_attrs):
+            if k not in kwargs:
                 kwargs[k] = getattr(flags, k)
-        button_params = self.html_params(name=field.name, **kwargs)
+        button_params = _render_params(self, field.name, kwargs)
         return Markup(f"<button {button_params}>{escape(label)}</button>")
 
 
@@ -388,10 +535,10 @@ class TextArea:
     def __call__(self, field, **kwargs):
         kwargs.setdefault("id", field.id)
         flags = getattr(field, "flags", {})
-        for k in dir(flags):
-            if k in self.validation_attrs and k not in kwargs:
+        for k in _flag_names(flags, self.validation_attrs):
+            if k not in kwargs:
                 kwargs[k] = getattr(flags, k)
-        textarea_params = html_params(name=field.name, **kwargs)
+        textarea_params = _render_params(self, field.name, kwargs)
         textarea_innerhtml = escape(field._value())
         return Markup(
             f"<textarea {textarea_params}>\r\n{textarea_innerhtml}</textarea>"
@@ -407,6 +554,12 @@ class Select:
 
     The field must provide an `iter_choices()` method which the widget will
     call on rendering; this method must yield :class:`Choice`.
+
+    For a :class:`~wtforms.fields.SelectField` or
+    :class:`~wtforms.fields.SelectMultipleField` listing its choices the
+    default way, each option is rendered once per set of choices, and only
+    the selected ones are rendered again on each call. Subclasses overriding
+    :meth:`render_option` have it called for every option instead.
     """
 
     validation_attrs = ["required", "disabled"]
@@ -415,40 +568,125 @@ class Select:
         self.multiple = multiple
 
     def __call__(self, field, **kwargs):
+        html = [self._select_tag(field, kwargs)]
+        if not self._render_cached_options(field, html):
+            self._render_options(field, html)
+        html.append("</select>")
+        return Markup("".join(html))
+
+    def render_iter(self, field, **kwargs):
+        """Yield the HTML of the select in chunks, one option at a time."""
+        yield Markup(self._select_tag(field, kwargs))
+        html = []
+        if self._render_cached_options(field, html):
+            yield from html
+        else:
+            yield from self._iter_options(field)
+        yield Markup("</select>")
+
+    def _select_tag(self, field, kwargs):
         kwargs.setdefault("id", field.id)
         if self.multiple:
             kwargs["multiple"] = True
         flags = getattr(field, "flags", {})
-        for k in dir(flags):
-            if k in self.validation_attrs and k not in kwargs:
+        for k in _flag_names(flags, self.validation_attrs):
+            if k not in kwargs:
                 kwargs[k] = getattr(flags, k)
-        select_params = html_params(name=field.name, **kwargs)
-        html = [f"<select {select_params}>"]
+        return f"<select {_render_params(self, field.name, kwargs)}>"
+
+    def _render_options(self, field, html):
+        html.extend(self._iter_options(field))
+
+    def _iter_options(self, field):
         render = type(self)._dispatch_render_option()
         if field.has_groups():
             for optgroup, choices in field._iter_groups_normalized():
                 if optgroup is not None:
-                    optgroup_params = html_params(label=optgroup)
-                    html.append(f"<optgroup {optgroup_params}>")
+                    yield Markup(f"<optgroup {html_params(label=optgroup)}>")
                 for choice in choices:
-                    html.append(render(choice))
+                    yield render(choice)
                 if optgroup is not None:
-                    html.append("</optgroup>")
+                    yield Markup("</optgroup>")
         else:
             for choice in field._iter_choices_normalized():
-                html.append(render(choice))
-        html.append("</select>")
-        return Markup("".join(html))
+                yield render(choice)
+
+    def _render_cached_options(self, field, html):
+        """Append the options of ``field`` to ``html`` from their unselected
+        HTML, rendered once per set of choices, only rendering the selected
+        options again. Return `False` if ``field`` or :meth:`render_option`
+        is customized, in which case the options must be rendered anew."""
+        render_option = type(self).render_option
+        if (
+            getattr(render_option, "__func__", None)
+            is not Select.render_option.__func__
+        ):
+            return False
+        render_choice_index = getattr(field, "_render_choice_index", None)
+        index = render_choice_index() if render_choice_index is not None else None
+        if index is None:
+            return False
+
+        fragments = index.option_html
+        if fragments is None:
+            fragments = index.option_html = self._render_unselected_options(
+                index.choices, index.escaped_labels
+            )
+        selected = field._selected_positions(index)
+        choices = index.choices
+
+        if not index.has_groups:
+            start = len(html)
+            html.extend(fragments)
+            for position in selected:
+                c = choices[position]
+                html[start + position] = self._option_html(
+                    c.value, escape(c.label or c.value), True, c.render_kw
+                )
+            return True
+
+        optgroup = None
+        for position, c in enumerate(choices):
+            if position == 0 or c.optgroup != optgroup:
+                if optgroup is not None:
+                    html.append("</optgroup>")
+                optgroup = c.optgroup
+                if optgroup is not None:
+                    html.append(f"<optgroup {html_params(label=optgroup)}>")
+            if position in selected:
+                label = escape(c.label or c.value)
+                html.append(self._option_html(c.value, label, True, c.render_kw))
+            else:
+                html.append(fragments[position])
+        if optgroup is not None:
+            html.append("</optgroup>")
+        return True
+
+    @classmethod
+    def _render_unselected_options(cls, choices, escaped_labels=None):
+        """Render each of ``choices``, a sequence of :class:`SelectChoice`, as
+        an unselected option."""
+        if escaped_labels is None:
+            escaped_labels = [escape(c.label or c.value) for c in choices]
+        return tuple(
+            cls._option_html(c.value, label, False, c.render_kw)
+            for c, label in zip(choices, escaped_labels, strict=True)
+        )
 
     @classmethod
     def render_option(cls, choice, **kwargs):
-        value = choice.value
+        label = escape(choice.label or choice.value)
+        return cls._option_html(
+            choice.value, label, choice.selected, choice.render_kw, **kwargs
+        )
+
+    @staticmethod
+    def _option_html(value, label, selected, render_kw, **kwargs):
         if isinstance(value, bool):
             value = str(value)
-        options = {"value": value, **(choice.render_kw or {}), **kwargs}
-        if choice.selected:
+        options = {"value": value, **(render_kw or {}), **kwargs}
+        if selected:
             options["selected"] = True
-        label = escape(choice.label or choice.value)
         return Markup(f"<option {html_params(**options)}>{label}</option>")
 
     @classmethod
@@ -7,6 +7,7 @@ from wtforms import validators
 from wtforms.fields import Field
 from wtforms.fields import StringField
 from wtforms.form import Form
+from wtforms.widgets import TextInput
 
 
 class F(Form):
@@ -24,6 +25,17 @@ def test_unbound_field():
         "render_kw": {"readonly": True, "foo": "bar"},
     }
     assert repr(unbound).startswith("<UnboundField(StringField")
+    assert not hasattr(unbound, "__dict__")
+    assert F.b.creation_counter > unbound.creation_counter
+
+
+def test_unbound_field_subclass_attributes():
+    class CustomUnboundField(type(F.a)):
+        pass
+
+    unbound = CustomUnboundField(StringField)
+    unbound.extra = "foo"
+    assert unbound.extra == "foo"
 
 
 def test_htmlstring():
@@ -114,6 +126,31 @@ def test_render_special():
     )
 
 
+def test_render_iter():
+    form = F()
+    chunks = list(form.a.render_iter(foo="baz"))
+    assert chunks == [form.a(foo="baz")]
+    assert isinstance(chunks[0], Markup)
+
+
+def test_render_iter_custom_meta_and_widget():
+    class CustomMeta(meta.DefaultMeta):
+        def render_field(self, field, render_kw):
+            return super().render_field(field, dict(render_kw, class_="m"))
+
+    class DataInput(TextInput):
+        def __call__(self, field, **kwargs):
+            return super().__call__(field, data_w="w", **kwargs)
+
+    class G(Form):
+        Meta = CustomMeta
+        s = StringField(widget=DataInput())
+
+    form = G()
+    assert "".join(form.s.render_iter()) == form.s()
+    assert 'class="m" data-w="w"' in form.s()
+
+
 def test_required_flag():
     form = F()
     assert form.b() == '<input id="b" name="b" required type="text" value="">'
@@ -213,3 +250,58 @@ def test_post():
     assert a.errors == ["Post"]
     stopped = _init_field("stop-post")
     assert stopped.errors == ["stop with message", "Post-stopped"]
+
+
+def test_cheap_validators_first():
+    calls = []
+
+    class Expensive:
+        cost = 100
+
+        def __call__(self, form, field):
+            calls.append("expensive")
+
+    def uncosted(form, field):
+        calls.append("uncosted")
+
+    class G(Form):
+        class Meta:
+            cheap_validators_first = True
+
+        a = StringField(
+            validators=[
+                validators.Optional(),
+                Expensive(),
+                validators.Length(max=3),
+                uncosted,
+                Expensive(),
+            ]
+        )
+
+    form = G(DummyPostData(a=["toolong"]))
+    assert not form.validate()
+    assert form.a.errors == ["Field cannot be longer than 3 characters."]
+    assert calls == []
+
+    form = G(DummyPostData(a=["ok"]))
+    assert form.validate()
+    assert calls == ["expensive", "uncosted", "expensive"]
+
+    calls.clear()
+    form = G(DummyPostData(a=[""]))
+    assert form.validate()
+    assert calls == []
+
+
+def test_validator_order_unchanged_by_default():
+    class G(Form):
+        a = StringField(
+            validators=[validators.Email(), validators.Length(max=3)],
+        )
+
+    form = G(DummyPostData(a=["toolong"]))
+    assert not form.validate()
+    assert form.a.errors == [
+        "Invalid email address.",
+        "Field cannot be longer than 3 characters.",
+    ]
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from tests.common import DummyPostData
@@ -224,3 +226,29 @@ def test_populate_property(F1):
     obj2 = ClassWithProperty()
     form.populate_obj(obj2)
     assert obj1.a_ == {"a": "new_a", "b": "new_b"}
+
+
+def test_reset_reuses_form(F1):
+    form = F1(DummyPostData({"a-a": [""]}))
+    assert not form.validate()
+    inner = form.a.form
+
+    form.reprocess(DummyPostData({"a-a": ["x"], "a-b": ["y"]}))
+    assert form.a.form is inner
+    assert form.a.data == {"a": "x", "b": "y"}
+    assert form.validate()
+
+    form.reprocess(a={"a": "z"})
+    assert form.a.form is inner
+    assert form.a.data == {"a": "z", "b": None}
+
+    form.reprocess(a={"a": "z", "meta": {"locales": ["fr"]}})
+    assert form.a.form is not inner
+
+
+def test_validate_async(F1):
+    form = F1(DummyPostData({"a-a": [""]}))
+    assert asyncio.run(form.validate_async()) is False
+    assert form.errors == {"a": {"a": ["This field is required."]}}
+    form = F1(DummyPostData({"a-a": ["x"]}))
+    assert asyncio.run(form.validate_async()) is True
@@ -1,3 +1,5 @@
+import pytest
+
 from wtforms.fields import Label
 from wtforms.fields import StringField
 from wtforms.form import Form
@@ -16,6 +18,20 @@ def test_label():
     assert repr(label) == "Label('test', 'Caption')"
 
 
+def test_label_slots():
+    label = Label("test", "Caption")
+    assert not hasattr(label, "__dict__")
+    with pytest.raises(AttributeError):
+        label.foo = "bar"
+
+    class CustomLabel(Label):
+        pass
+
+    label = CustomLabel("test", "Caption")
+    label.foo = "bar"
+    assert label.foo == "bar"
+
+
 def test_auto_label():
     t1 = StringField().bind(Form(), "foo_bar")
     assert t1.label.text == "Foo Bar"
@@ -1,4 +1,7 @@
+import asyncio
+import threading
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -6,6 +9,8 @@ from tests.common import DummyPostData
 from wtforms import validators
 from wtforms.fields import FieldList
 from wtforms.fields import FormField
+from wtforms.fields import HiddenField
+from wtforms.fields import IntegerField
 from wtforms.fields import StringField
 from wtforms.form import Form
 from wtforms.meta import DefaultMeta
@@ -218,6 +223,47 @@ def test_entry_management_by_index_with_subforms():
     assert [entry.foo.name for entry in a.entries] == ["a-0-foo", "a-1-foo"]
 
 
+def test_renamed_entries_rename_descendants_on_access():
+    class Cell(Form):
+        v = StringField()
+
+    class Row(Form):
+        cells = FieldList(FormField(Cell), min_entries=2)
+        tags = FieldList(FieldList(StringField(), min_entries=1), min_entries=1)
+
+    F = make_form(rows=FieldList(FormField(Row), min_entries=3))
+    rows = F().rows
+    rows.insert_entry(0)
+    rows.insert_entry(0)
+    rows.pop_entry(1)
+
+    # Descendants are left alone until they are accessed.
+    assert "form" not in rows[2].__dict__
+    cells = rows[2].form.cells
+    assert "entries" not in cells.__dict__
+    assert [c.v.name for c in cells] == ["rows-2-cells-0-v", "rows-2-cells-1-v"]
+    assert [c.v.id for c in cells] == ["rows-2-cells-0-v", "rows-2-cells-1-v"]
+    assert cells[1].v.label.field_id == "rows-2-cells-1-v"
+
+    tags = rows[3].tags[0]
+    assert tags.append_entry().name == "rows-3-tags-0-1"
+    assert [t.name for t in tags] == ["rows-3-tags-0-0", "rows-3-tags-0-1"]
+
+
+def test_renamed_entries_reprocess_formdata():
+    class Inside(Form):
+        foo = StringField()
+
+    F = make_form(a=FieldList(FormField(Inside), min_entries=2))
+    form = F()
+    form.a.insert_entry(0)
+    form.a.reset()
+    # The entry first named a-0 is reused as a-1 to read its formdata.
+    form.a.process(DummyPostData({"a-1-foo": "x"}))
+    assert form.a.data == [{"foo": "x"}, {"foo": "x"}]
+    assert [e.foo.name for e in form.a] == ["a-0-foo", "a-1-foo"]
+
+
 def test_gap_compacted_through_formdata_round_trip():
     """A formdata with gaps in indices is compacted on read: entries are
     rebuilt with consecutive indices, preserving formdata key order."""
@@ -260,6 +306,35 @@ def test_formdata_index_drives_entry_order():
     ]
 
 
+def test_formdata_keys_indexed_once():
+    class CountingPostData(DummyPostData):
+        iterations = 0
+
+        def __iter__(self):
+            CountingPostData.iterations += 1
+            return super().__iter__()
+
+    inner = make_form("Inner", title=StringField(), cells=FieldList(StringField()))
+    F = make_form(rows=FieldList(FormField(inner)), other=FieldList(t))
+    data = {"other-0": "o", "rows-x": "ignored", "rows": "ignored"}
+    for r in range(4):
+        data[f"rows-{r}-title"] = f"r{r}"
+        for c in range(r):
+            data[f"rows-{r}-cells-{c}"] = f"{r}.{c}"
+    form = F(CountingPostData(data))
+
+    assert CountingPostData.iterations == 1
+    assert form.other.data == ["o"]
+    assert form.rows.data == [
+        {"title": f"r{r}", "cells": [f"{r}.{c}" for c in range(r)]} for r in range(4)
+    ]
+
+    # A list processed by itself indexes the formdata for its entries.
+    form.rows.process(CountingPostData(data))
+    assert CountingPostData.iterations == 2
+    assert len(form.rows.entries) == 4
+
+
 def test_min_max_entries():
     F = make_form(a=FieldList(t, min_entries=1, max_entries=3))
     a = F().a
@@ -409,3 +484,177 @@ def test_formdata_with_sparse_indices_keeps_entry_obj_alignment():
     assert user.addresses[1].street == "C street updated"
     assert a1 not in user.addresses
     assert a1.street == "B street"
+
+
+def test_reset_reuses_entries():
+    F = make_form(a=FieldList(t, min_entries=1))
+    form = F(DummyPostData({"a-0": ["x"], "a-1": ["y"], "a-2": [""]}))
+    assert not form.validate()
+    first, second, third = form.a.entries
+
+    form.reprocess(DummyPostData({"a-0": ["z"], "a-4": ["w"]}))
+    assert form.a.entries == [first, second]
+    assert form.a.data == ["z", "w"]
+    assert [e.name for e in form.a] == ["a-0", "a-1"]
+    assert form.validate()
+
+    form.reprocess(DummyPostData({"a-0": ["1"], "a-1": ["2"], "a-2": ["3"]}))
+    assert form.a.entries[:2] == [first, second]
+    assert form.a.entries[2] is third
+    assert not third.errors
+
+    formdata = DummyPostData({"a-2": ["1"], "a-5": ["2"]})
+    form.reprocess(formdata)
+    assert [e.label.text for e in form.a] == [e.label.text for e in F(formdata).a]
+    assert [e.label.text for e in form.a] == ["A-2", "A-5"]
+
+    form.reprocess(a=["1", "2", "3", "4"])
+    assert form.a.entries[:3] == [first, second, third]
+    assert form.a.data == ["1", "2", "3", "4"]
+
+
+def test_reset_keeps_explicit_entry_labels():
+    F = make_form(a=FieldList(StringField("Tag"), min_entries=1))
+    form = F(DummyPostData({"a-0": ["x"], "a-1": ["y"]}))
+    form.reprocess(DummyPostData({"a-3": ["x"], "a-0": ["y"]}))
+    assert [e.label.text for e in form.a] == ["Tag", "Tag"]
+
+
+def test_pop_entry_keeps_prefix():
+    F = make_form(a=FieldList(t, min_entries=2))
+    form = F(prefix="p")
+    form.a.pop_entry(0)
+    entry = form.a.entries[0]
+    assert entry.name == "p-a-0"
+    assert entry.id == "p-a-0"
+    assert entry.label.field_id == "p-a-0"
+
+
+def test_validate_async():
+    async def not_foo(form, field):
+        await asyncio.sleep(0)
+        if field.data == "foo":
+            raise validators.ValidationError("foo")
+
+    async def two(form, field):
+        if len(field.entries) != 2:
+            raise validators.ValidationError("two")
+
+    F = make_form(a=FieldList(StringField(validators=[not_foo]), validators=[two]))
+    form = F(a=["foo", "bar", "baz"])
+    assert asyncio.run(form.validate_async()) is False
+    assert form.a.errors == [["foo"], [], [], "two"]
+
+    form = F(a=["bar", "baz"])
+    assert asyncio.run(form.validate_async()) is True
+    assert form.a.errors == []
+
+
+def test_validate_with_executor():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def slow(form, field):
+        barrier.wait()
+        if field.data == "bad":
+            raise validators.ValidationError("bad")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        F = make_form(a=FieldList(StringField(validators=[slow]), executor=executor))
+        form = F(a=["ok", "bad", "ok"])
+        assert not form.validate()
+    assert form.a.errors == [[], ["bad"], []]
+
+
+def test_validate_nested_lists_with_shared_executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        Row = make_form(
+            "Row",
+            tags=FieldList(
+                StringField(validators=[validators.DataRequired()]), executor=executor
+            ),
+        )
+        F = make_form(rows=FieldList(FormField(Row), executor=executor))
+        form = F(rows=[{"tags": ["a", "b"]}, {"tags": ["c", ""]}, {"tags": ["d", "e"]}])
+        results = []
+        thread = threading.Thread(target=lambda: results.append(form.validate()))
+        thread.daemon = True
+        thread.start()
+        thread.join(timeout=5)
+    assert results == [False]
+    assert form.rows[1].tags.errors == [[], ["This field is required."]]
+
+
+def test_render_iter_streams_entries():
+    inner = make_form("Inner", a=StringField(), h=HiddenField())
+    F = make_form(rows=FieldList(FormField(inner), min_entries=3))
+    form = F()
+    chunks = list(form.rows.render_iter())
+    assert "".join(chunks) == form.rows()
+    assert not any("rows-0-a" in c and "rows-1-a" in c for c in chunks)
+
+
+def test_columnar_matches_entries():
+    def make(**kwargs):
+        inner = IntegerField(validators=[validators.NumberRange(0, 10)])
+        return make_form(a=FieldList(inner, min_entries=4, max_entries=5, **kwargs))
+
+    formdata = DummyPostData({"a-3": "5", "a-9": "12", "a-1": "x"})
+    data = {"a": [7, 8, 9]}
+    columnar = make(columnar=True)(formdata, data=data)
+    entries = make()(formdata, data=data)
+    assert columnar.a._columns is not None
+    assert len(columnar.a) == len(entries.a) == 4
+    assert columnar.a.data == entries.a.data == [None, 5, 12, 5]
+    assert columnar.validate() is entries.validate() is False
+    assert columnar.errors == entries.errors
+    obj = AttrDict(a=[])
+    columnar.populate_obj(obj)
+    assert obj.a == entries.a.data
+
+    assert columnar.a._columns is not None
+    assert columnar.a() == entries.a()
+    assert columnar.a._columns is None
+    assert [f.name for f in columnar.a] == ["a-0", "a-1", "a-2", "a-3"]
+    assert [f.errors for f in columnar.a] == [f.errors for f in entries.a]
+    assert [f.raw_data for f in columnar.a] == [f.raw_data for f in entries.a]
+
+
+def test_columnar_entries_can_be_edited():
+    F = make_form(a=FieldList(IntegerField(), columnar=True))
+    form = F(a=[1, 2])
+    form.a.append_entry(3)
+    assert form.a.pop_entry().data == 3
+    assert form.a.data == [1, 2]
+    form.a.reset()
+    form.process(DummyPostData({"a-0": "4"}))
+    assert form.a.data == [4]
+    assert asyncio.run(form.validate_async()) is True
+    assert form.a.errors == []
+
+
+def test_columnar_validates_empty_list():
+    F = make_form(a=FieldList(IntegerField(), columnar=True))
+    form = F()
+    assert form.validate() is True
+    assert form.a.errors == []
+    form = F()
+    assert asyncio.run(form.validate_async()) is True
+    assert form.a.errors == []
+
+
+def test_columnar_falls_back_to_entries():
+    class Tags(StringField):
+        def pre_validate(self, form):
+            self.seen = True
+
+    F = make_form(a=FieldList(Tags(), columnar=True))
+    form = F(a=["x", "y"])
+    assert form.validate() is True
+    assert form.a._columns is None
+    assert [f.seen for f in form.a] == [True, True]
+
+
+def test_columnar_rejects_enclosing_fields():
+    F = make_form(a=FieldList(FormField(make_form()), columnar=True))
+    with pytest.raises(TypeError):
+        F()
@@ -1,5 +1,6 @@
 from tests.common import DummyPostData
 from wtforms import validators
+from wtforms.fields import ChoicesProvider
 from wtforms.fields import RadioField
 from wtforms.fields.choices import SelectChoice
 from wtforms.form import Form
@@ -129,3 +130,26 @@ def test_render_kw_preserved():
         '<input disabled id="a-1" name="a" type="radio" value="False"> '
         '<label for="a-1">no</label></li></ul>'
     )
+
+
+def test_radio_field_choices_provider():
+    class Provider(ChoicesProvider):
+        render_limit = 2
+
+        def contains(self, value):
+            return value in ("a", "b", "c")
+
+        def label_for(self, value):
+            return value.upper() if self.contains(value) else None
+
+        def iter_window(self, start=0, stop=None):
+            return ["a", "b", "c"][start:stop]
+
+    F = make_form(a=RadioField(choices=Provider()))
+    form = F(a="c")
+    assert [(opt.data, opt.checked) for opt in form.a] == [
+        ("c", True),
+        ("a", False),
+        ("b", False),
+    ]
+    assert form.validate()
@@ -1,3 +1,5 @@
+import copy
+import pickle
 import sys
 from enum import Enum
 from enum import IntEnum
@@ -8,11 +10,14 @@ from tests.common import DummyPostData
 from wtforms import validators
 from wtforms import widgets
 from wtforms.fields import Choice
+from wtforms.fields import ChoiceCatalog
+from wtforms.fields import ChoicesProvider
 from wtforms.fields import enum_choices
 from wtforms.fields import enum_coerce
 from wtforms.fields import Field
 from wtforms.fields import SelectChoice
 from wtforms.fields import SelectField
+from wtforms.fields import SelectMultipleField
 from wtforms.form import Form
 
 if sys.version_info >= (3, 11):
@@ -46,6 +51,13 @@ def test_select_field_copies_choices():
     assert f1.items.choices is not f2.items.choices
 
 
+def test_select_choice_slots():
+    choice = SelectChoice("a", optgroup="g")
+    assert not hasattr(choice, "__dict__")
+    assert tuple(choice) == ("a", "a", {}, "g")
+    assert SelectChoice.from_input(choice, "h").optgroup == "h"
+
+
 class F(Form):
     a = SelectField(
         choices=[
@@ -100,7 +112,9 @@ def test_value_coercion():
 def test_iterable_options():
     form = F()
     first_option = list(form.a)[0]
-    assert isinstance(first_option, Field)
+    assert isinstance(first_option, SelectField._Option)
+    assert not hasattr(first_option, "__dict__")
+    assert first_option.label() == '<label for="a-0">hello</label>'
     assert list(str(x) for x in form.a) == [
         '<option selected value="a">hello</option>',
         '<option value="btest">bye</option>',
@@ -808,3 +822,257 @@ def test_select_field_enum_renders_selected():
     )
     form = F(a=_Provider.GITLAB)
     assert '<option selected value="gitlab">GITLAB</option>' in form.a()
+
+
+def test_select_field_choices_normalized_once():
+    calls = []
+
+    def coerce(value):
+        calls.append(value)
+        return int(value)
+
+    F = make_form(a=SelectField(choices=[("1", "One"), ("2", "Two")], coerce=coerce))
+    with pytest.warns(DeprecationWarning):
+        form = F(DummyPostData(a=["2"]))
+    calls.clear()
+    assert form.validate()
+    form.a()
+    assert [c.selected for c in form.a.iter_choices()] == [False, True]
+    assert calls == ["1", "2"]
+
+
+def test_select_field_choices_edited_in_place():
+    F = make_form(a=SelectField(choices=["a", "b"]))
+    form = F(DummyPostData(a=["c"]))
+    assert not form.validate()
+    assert "b" in form.a()
+
+    form.a.choices[1] = "c"
+    assert form.validate()
+    assert "b" not in form.a()
+    assert [c.value for c in form.a.iter_choices()] == ["a", "c"]
+
+    F = make_form(a=SelectField(choices={"a": "A", "b": "B"}))
+    form = F()
+    assert ">B</option>" in form.a()
+    form.a.choices["b"] = "Bee"
+    assert ">Bee</option>" in form.a()
+
+    F = make_form(a=SelectField(choices=[SelectChoice("a"), SelectChoice("b")]))
+    form = F(DummyPostData(a=["c"]))
+    assert not form.validate()
+    form.a.choices[1].value = "c"
+    assert form.validate()
+    form.a.choices[1].optgroup = "G"
+    assert form.a.has_groups()
+
+
+def test_select_renders_choices_edited_in_place():
+    F = make_form(a=SelectField(choices=[SelectChoice("a", "A"), SelectChoice("b")]))
+    form = F()
+    assert form.a() == (
+        '<select id="a" name="a"><option value="a">A</option>'
+        '<option value="b">b</option></select>'
+    )
+    form.a.choices[0].label = "Ay"
+    form.a.choices[1].render_kw["class"] = "x"
+    expected = (
+        '<select id="a" name="a"><option value="a">Ay</option>'
+        '<option class="x" value="b">b</option></select>'
+    )
+    assert form.a() == expected
+    assert "".join(form.a.render_iter()) == expected
+
+
+def test_select_field_choices_reassigned():
+    F = make_form(a=SelectField(choices=["a", "b"]))
+    form = F(DummyPostData(a=["c"]))
+    assert not form.validate()
+
+    form.a.choices = ["a", "c"]
+    assert form.validate()
+
+    form.a.choices.append("d")
+    form.a.data = "d"
+    assert form.validate()
+    assert [c.value for c in form.a.iter_choices() if c.selected] == ["d"]
+
+    form.a.coerce = lambda v: v.upper()
+    form.a.data = "D"
+    assert form.validate()
+
+
+def test_select_field_callable_choices_not_cached():
+    available = ["a"]
+    F = make_form(a=SelectField())
+    form = F(DummyPostData(a=["b"]))
+    form.a.choices = lambda: list(available)
+    assert not form.validate()
+    available.append("b")
+    assert form.validate()
+
+
+def test_select_field_overridden_iter_choices_validates():
+    class OnlyA(SelectField):
+        def iter_choices(self):
+            return [Choice("a", "A", self.data == "a", {})]
+
+    F = make_form(a=OnlyA(choices=["a", "b"]))
+    assert F(DummyPostData(a=["a"])).validate()
+    assert not F(DummyPostData(a=["b"])).validate()
+
+
+def test_choice_catalog_shared_between_forms():
+    calls = []
+
+    def coerce(value):
+        calls.append(value)
+        return int(value)
+
+    catalog = ChoiceCatalog(
+        [SelectChoice("1", "One"), SelectChoice("2", "<Two>", optgroup="g")],
+        coerce=coerce,
+    )
+    assert calls == ["1", "2"]
+    assert len(catalog) == 2
+    assert catalog.has_groups
+    assert 2 in catalog and 3 not in catalog
+    assert catalog.escaped_labels == ("One", "&lt;Two&gt;")
+
+    F = make_form(
+        a=SelectField(choices=catalog, coerce=coerce),
+        b=SelectMultipleField(choices=catalog, coerce=coerce),
+    )
+    for _ in range(2):
+        form = F(DummyPostData(a=["2"], b=["1", "2"]))
+        assert form.a.choices is catalog
+        assert form.validate()
+        assert '<option selected value="2">&lt;Two&gt;</option>' in form.a()
+        assert [c.selected for c in form.b.iter_choices()] == [True, True]
+    # Only the submitted values are coerced for each form.
+    assert calls == ["1", "2"] + ["2", "1", "2"] * 2
+
+    form = F(DummyPostData(a=["3"]))
+    assert not form.validate()
+    assert form.a.errors == ["Not a valid choice."]
+
+
+def test_choice_catalog_other_coerce():
+    catalog = ChoiceCatalog(["1", "2"])
+    F = make_form(a=SelectField(choices=catalog, coerce=int))
+    form = F(DummyPostData(a=["2"]))
+    assert form.validate()
+    assert form.a.data == 2
+
+
+def test_choice_catalog_immutable():
+    catalog = ChoiceCatalog({"fr": "France", "Other": {"xx": "Elsewhere"}})
+    assert [c.optgroup for c in catalog] == [None, "Other"]
+    with pytest.raises(AttributeError):
+        catalog.coerce = int
+    with pytest.raises(AttributeError):
+        del catalog.choices
+    assert copy.copy(catalog) is catalog
+    assert copy.deepcopy(catalog) is catalog
+
+    restored = pickle.loads(pickle.dumps(catalog))
+    assert restored.choices == catalog.choices
+    assert restored.coerce is str
+
+
+def test_choice_catalog_copies_choices():
+    original = SelectChoice("a", "A")
+    catalog = ChoiceCatalog([original])
+    original.label = "Changed"
+    original.render_kw["class"] = "x"
+    assert list(catalog) == [SelectChoice("a", "A")]
+    F = make_form(a=SelectField(choices=catalog))
+    assert F().a() == '<select id="a" name="a"><option value="a">A</option></select>'
+
+
+def test_choice_catalog_input():
+    with pytest.raises(TypeError):
+        ChoiceCatalog(lambda: ["a"])
+    with pytest.warns(DeprecationWarning):
+        catalog = ChoiceCatalog([("a", "A")])
+    assert catalog.choices == (SelectChoice("a", "A"),)
+
+
+class NumbersProvider(ChoicesProvider):
+    """Choices 0 to 499999, labelled ``#n``."""
+
+    render_limit = 3
+
+    def __init__(self):
+        self.windows = []
+
+    def contains(self, value):
+        return isinstance(value, int) and 0 <= value < 500000
+
+    def label_for(self, value):
+        return f"#{value}" if self.contains(value) else None
+
+    def iter_window(self, start=0, stop=None):
+        self.windows.append((start, stop))
+        stop = 500000 if stop is None else stop
+        return (SelectChoice(str(n), f"#{n}") for n in range(start, stop))
+
+
+def test_choices_provider_validates_without_listing():
+    provider = NumbersProvider()
+    F = make_form(
+        a=SelectField(choices=provider, coerce=int),
+        b=SelectMultipleField(choices=provider, coerce=int),
+    )
+    form = F(DummyPostData(a=["123456"], b=["1", "499999"]))
+    assert form.a.choices is provider
+    assert form.validate()
+    assert provider.windows == []
+
+    form = F(DummyPostData(a=["500000"], b=["1", "-1"]))
+    assert not form.validate()
+    assert form.a.errors == ["Not a valid choice."]
+    assert form.b.errors == ["'-1' is not a valid choice for this field."]
+
+
+def test_choices_provider_renders_window_and_selected():
+    provider = NumbersProvider()
+    F = make_form(
+        a=SelectField(choices=provider, coerce=int),
+        b=SelectMultipleField(choices=provider, coerce=int),
+    )
+    form = F(DummyPostData(a=["1"], b=["2", "400000", "-5"]))
+    assert form.a() == (
+        '<select id="a" name="a">'
+        '<option value="0">#0</option>'
+        '<option selected value="1">#1</option>'
+        '<option value="2">#2</option>'
+        "</select>"
+    )
+    assert [(c.value, c.selected) for c in form.b.iter_choices()] == [
+        (400000, True),
+        ("0", False),
+        ("1", False),
+        ("2", True),
+    ]
+    assert provider.windows == [(0, 3), (0, 3)]
+
+
+def test_field_based_option_class():
+    """A field declaring an ``_Option`` based on :class:`Field` still gets
+    its options bound and processed."""
+
+    class LegacyOptions(SelectField):
+        class _Option(Field):
+            def _value(self):
+                return f"[{self.data}]"
+
+    F = make_form(
+        a=LegacyOptions(choices=["x"], validators=[validators.input_required()])
+    )
+    form = F(a="x")
+    (opt,) = form.a
+    assert isinstance(opt, Field)
+    assert opt.flags.required
+    assert str(opt) == '<option selected value="x">x</option>'
+    assert opt._value() == "[x]"
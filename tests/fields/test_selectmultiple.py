@@ -340,3 +340,16 @@ def test_select_multiple_enum_intenum_round_trip():
     form = F(DummyPostData(a=["2", "5"]))
     assert form.validate()
     assert form.a.data == [_Kind.SMALL, _Kind.BIG]
+
+
+def test_select_multiple_selected_from_index():
+    F = make_form(
+        a=SelectMultipleField(choices=["1", "2", "3", "2"], coerce=int),
+    )
+    form = F(DummyPostData(a=["2", "3"]))
+    assert form.validate()
+    assert [c.selected for c in form.a.iter_choices()] == [False, True, True, True]
+
+    form = F(DummyPostData(a=["2", "4"]))
+    assert not form.validate()
+    assert form.a.errors == ["'4' is not a valid choice for this field."]
@@ -1,12 +1,19 @@
+import asyncio
+import copy
+from collections import OrderedDict
+
 import pytest
 
 from tests.common import DummyPostData
+from wtforms.fields import FormField
 from wtforms.fields import IntegerField
+from wtforms.fields import SelectField
 from wtforms.fields import StringField
 from wtforms.form import BaseForm
 from wtforms.form import Form
 from wtforms.meta import DefaultMeta
 from wtforms.validators import DataRequired
+from wtforms.validators import StopValidation
 from wtforms.validators import ValidationError
 
 
@@ -97,20 +104,42 @@ def test_form_meta_monkeypatch():
     class F(Form):
         a = StringField()
 
-    assert F._unbound_fields is None
-    F()
     assert F._unbound_fields == [("a", F.a)]
     F.b = StringField()
-    assert F._unbound_fields is None
+    assert F._unbound_fields == [("a", F.a), ("b", F.b)]
     F()
     assert F._unbound_fields == [("a", F.a), ("b", F.b)]
     del F.a
     with pytest.raises(AttributeError):
         F.a  # noqa: B018
-    F()
     assert F._unbound_fields == [("b", F.b)]
     F._m = StringField()
     assert F._unbound_fields == [("b", F.b)]
+    F.b = None
+    assert F._unbound_fields == []
+
+
+def test_form_meta_monkeypatch_subclasses():
+    class Mixin:
+        m = StringField()
+
+    class A(Form):
+        a = StringField()
+
+    class B(Mixin, A):
+        pass
+
+    class C(B):
+        a = IntegerField()
+
+    assert B._unbound_fields == [("m", Mixin.m), ("a", A.a)]
+    A.x = StringField()
+    assert B._unbound_fields == [("m", Mixin.m), ("a", A.a), ("x", A.x)]
+    assert C._unbound_fields == [("m", Mixin.m), ("a", C.a), ("x", A.x)]
+    del A.a
+    assert B._unbound_fields == [("m", Mixin.m), ("x", A.x)]
+    assert C._unbound_fields == [("m", Mixin.m), ("a", C.a), ("x", A.x)]
+    assert [f.name for f in C()] == ["m", "a", "x"]
 
 
 def test_form_meta_subclassing():
@@ -344,3 +373,341 @@ def test_meta_basic():
 def test_meta_missing_diamond():
     meta = MissingDiamond().meta
     assert type(meta).__bases__ == (H.Meta, G.Meta, DefaultMeta)
+
+
+class PrototypeForm(Form):
+    class Meta:
+        field_prototypes = True
+
+    name = StringField(validators=[DataRequired()])
+    age = IntegerField()
+
+
+def test_field_prototypes_match_eager_binding():
+    class EagerForm(PrototypeForm):
+        class Meta:
+            field_prototypes = False
+
+    formdata = DummyPostData(name=["foo"], age=["12"])
+    for prefix in ("", "p"):
+        form = PrototypeForm(formdata, prefix=prefix)
+        eager = EagerForm(formdata, prefix=prefix)
+        assert form.data == eager.data
+        assert [f.name for f in form] == [f.name for f in eager]
+        assert [f.id for f in form] == [f.id for f in eager]
+        assert str(form.name.label) == str(eager.name.label)
+        assert form.name() == eager.name()
+        assert form.validate() == eager.validate()
+        assert form.errors == eager.errors
+
+
+def test_field_prototypes_are_cloned_per_instance():
+    form1 = PrototypeForm()
+    form2 = PrototypeForm()
+    assert form1.name is not form2.name
+    assert form1.name._form is form1
+    assert form2.name.meta is form2.meta
+
+    form1.name.label.text = "Changed"
+    form1.name.flags.required = False
+    assert form2.name.label.text == "Name"
+    assert form2.name.flags.required is True
+
+    form1.validate()
+    assert form1.name.errors == ["This field is required."]
+    assert form2.name.errors == ()
+
+
+def test_field_prototypes_cache_per_prefix_and_locales():
+    class F(PrototypeForm):
+        pass
+
+    F()
+    F(prefix="a")
+    F(meta={"locales": ["de_DE"]})
+    assert set(F._wtforms_prototypes) == {
+        ("", False),
+        ("a-", False),
+        ("", ("de_DE",)),
+    }
+    assert F(meta={"locales": ["de_DE"]}).name.validate(None) is False
+    F.extra = StringField()
+    assert F._wtforms_prototypes == {}
+    assert F().extra.name == "extra"
+
+
+def test_field_prototypes_copy_render_kw_and_validators():
+    class F(PrototypeForm):
+        title = StringField(render_kw={"class": "input"}, validators=[DataRequired()])
+
+    form = F()
+    form.title.render_kw["class"] = "is-invalid"
+    form.title.validators.append(lambda form, field: None)
+    form.name.validators.append(lambda form, field: None)
+    fresh = F()
+    assert fresh.title.render_kw == {"class": "input"}
+    assert len(fresh.title.validators) == 1
+    assert len(fresh.name.validators) == 1
+    assert 'class="input"' in fresh.title()
+
+
+def test_field_prototypes_follow_overridden_translations():
+    language = ["en"]
+
+    class Translations:
+        def gettext(self, string):
+            return string.upper() if language[0] == "up" else string
+
+        def ngettext(self, singular, plural, n):
+            return self.gettext(singular if n == 1 else plural)
+
+    class F(PrototypeForm):
+        class Meta:
+            def get_translations(self, form):
+                return Translations()
+
+        first_name = SelectField(choices=["a"])
+
+    assert F().first_name.label.text == "First Name"
+    language[0] = "up"
+    form = F(DummyPostData(first_name=["b"]))
+    assert form.first_name.label.text == "FIRST NAME"
+    assert form.validate() is False
+    assert form.first_name.errors == ["NOT A VALID CHOICE."]
+    assert F._wtforms_prototypes == {}
+
+
+def test_field_prototypes_skip_csrf_field():
+    class F(PrototypeForm):
+        class Meta:
+            csrf = True
+            csrf_secret = b"foo"
+            csrf_context = {}
+
+    form = F()
+    assert "csrf_token" in form
+    assert "csrf_token" not in F._wtforms_prototypes[("", False)]
+
+
+class LazyForm(Form):
+    class Meta:
+        lazy_fields = True
+
+    name = StringField(validators=[DataRequired()])
+    age = IntegerField()
+
+
+def test_lazy_fields_bind_on_access():
+    form = LazyForm(DummyPostData(name=["foo"], age=["12"]))
+    assert "age" not in form.__dict__
+    assert form.name.data == "foo"
+    assert "name" in form.__dict__
+    assert "age" not in form.__dict__
+    assert form["age"].data == 12
+    assert form.age is form["age"]
+
+
+def test_lazy_fields_match_eager_binding():
+    class EagerForm(LazyForm):
+        class Meta:
+            lazy_fields = False
+
+    formdata = DummyPostData(name=["foo"], age=["x"])
+    form = LazyForm(formdata, prefix="p")
+    eager = EagerForm(formdata, prefix="p")
+    assert [f.name for f in form] == [f.name for f in eager]
+    assert form.data == eager.data
+    assert form.validate() == eager.validate()
+    assert form.errors == eager.errors
+
+
+def test_lazy_fields_replay_latest_process():
+    form = LazyForm(name="foo")
+    form.process(DummyPostData(age=["3"]))
+    assert form.name.data is None
+    assert form.age.data == 3
+
+
+def test_lazy_fields_removal():
+    form = LazyForm()
+    del form.age
+    assert "age" not in form
+    assert form.age is None
+    assert [f.short_name for f in form] == ["name"]
+
+
+def test_lazy_fields_copy():
+    form = LazyForm(DummyPostData(name=["foo"], age=["12"]))
+    fields = form._fields.copy()
+    assert type(fields) is OrderedDict
+    assert [f.data for f in fields.values()] == ["foo", 12]
+    assert fields["age"] is form.age
+
+    fields = copy.copy(LazyForm(age=3)._fields)
+    assert type(fields) is OrderedDict
+    assert fields["age"].data == 3
+
+
+def test_reprocess_reuses_fields():
+    class F(Form):
+        a = StringField(validators=[DataRequired()])
+        b = IntegerField()
+
+    form = F(DummyPostData(b=["x"]))
+    form.validate()
+    form.form_errors.append("form error")
+    a, b = form.a, form.b
+    assert form.errors
+
+    form.reprocess(data={"a": "foo", "b": 2})
+    assert form.a is a
+    assert form.b is b
+    assert form.errors == {}
+    assert not form.b.process_errors
+    assert form.b.raw_data is None
+    assert form.data == {"a": "foo", "b": 2}
+    assert form.validate()
+
+    form.reprocess(DummyPostData(a=["bar"]))
+    assert form.data == {"a": "bar", "b": None}
+
+
+def test_reprocess_extra_filters_with_inline_filter():
+    class F(Form):
+        a = StringField()
+
+        def filter_a(self, value):
+            return value and value + "!"
+
+    form = F()
+    filters = {"a": [str.upper]}
+    form.reprocess(a="x", extra_filters=filters)
+    form.reprocess(a="x", extra_filters=filters)
+    assert form.a.data == "X!"
+    assert filters == {"a": [str.upper]}
+
+
+def test_form_pool():
+    from wtforms.form import FormPool
+
+    pool = FormPool(F, prefix="p", maxsize=1)
+    form = pool.acquire(DummyPostData({"p-test": ["foobar"]}))
+    assert form.validate()
+    assert len(pool) == 0
+    pool.release(form)
+    pool.release(F(prefix="p"))
+    assert len(pool) == 1
+
+    again = pool.acquire(DummyPostData({"p-test": ["nope"]}))
+    assert again is form
+    assert not again.validate()
+    assert again.errors == {"test": ["error"]}
+
+
+def test_validate_many():
+    class F(Form):
+        name = StringField(validators=[DataRequired()])
+        age = IntegerField()
+
+    rows = iter(
+        [
+            {"name": "foo", "age": "12"},
+            DummyPostData(name=[""], age=["x"]),
+            {"name": None, "age": 3},
+        ]
+    )
+    results = F().validate_many(rows)
+    assert next(results) == (0, {"name": "foo", "age": 12}, {})
+    index, data, errors = next(results)
+    assert index == 1
+    assert errors == {
+        "name": ["This field is required."],
+        "age": ["Not a valid integer value."],
+    }
+    index, data, errors2 = next(results)
+    assert data == {"name": None, "age": 3}
+    assert errors2["name"][0] is errors["name"][0]
+    assert errors2["name"] is not errors["name"]
+    assert next(results, None) is None
+
+
+def test_validate_many_extra_validators():
+    def extra(form, field):
+        raise ValidationError("extra")
+
+    results = list(F().validate_many([{"test": "foobar"}], {"test": [extra]}))
+    assert results == [(0, {"test": "foobar"}, {"test": ["extra"]})]
+
+
+def test_validate_async():
+    events = []
+
+    async def taken(form, field):
+        events.append(("start", field.name))
+        await asyncio.sleep(0)
+        events.append(("end", field.name))
+        if field.data == "taken":
+            raise ValidationError("taken")
+
+    async def stop(form, field):
+        raise StopValidation("stop")
+
+    def never(form, field):
+        raise AssertionError()
+
+    class F(Form):
+        a = StringField(validators=[taken])
+        b = StringField(validators=[taken, stop, never])
+
+        async def validate_a(self, field):
+            await asyncio.sleep(0)
+            raise ValidationError("inline")
+
+    form = F(a="taken", b="free")
+    assert asyncio.run(form.validate_async()) is False
+    assert form.errors == {"a": ["taken", "inline"], "b": ["stop"]}
+    assert events[:2] == [("start", "a"), ("start", "b")]
+
+    with pytest.raises(TypeError, match="validate_async"):
+        form.validate()
+
+
+def test_validate_async_sync_validators():
+    form = F(test="foobar")
+    assert asyncio.run(form.validate_async()) is True
+    form = F(test="nope")
+    assert asyncio.run(form.validate_async()) is False
+    assert form.errors == {"test": ["error"]}
+
+
+def test_validate_async_calls_overridden_validate():
+    class Pw(Form):
+        password = StringField()
+        confirm = StringField()
+
+        def validate(self, extra_validators=None):
+            if not super().validate(extra_validators):
+                return False
+            if self.password.data != self.confirm.data:
+                self.form_errors.append("mismatch")
+                return False
+            return True
+
+    class Upper(StringField):
+        def validate(self, form, extra_validators=()):
+            self.errors = [] if self.data.isupper() else ["lower"]
+            return not self.errors
+
+    class F(Form):
+        pw = FormField(Pw)
+        name = Upper()
+
+    assert Pw(password="a", confirm="b").validate() is False
+    form = Pw(password="a", confirm="b")
+    assert asyncio.run(form.validate_async()) is False
+    assert form.form_errors == ["mismatch"]
+
+    form = F(pw={"password": "a", "confirm": "b"}, name="x")
+    assert asyncio.run(form.validate_async()) is False
+    assert form.pw.form.form_errors == ["mismatch"]
+    assert form.name.errors == ["lower"]
@@ -1,7 +1,13 @@
 import pytest
 from markupsafe import Markup
 
+from tests.common import DummyPostData
 from wtforms.fields.choices import Choice
+from wtforms.fields.choices import ChoiceCatalog
+from wtforms.fields.choices import SelectChoice
+from wtforms.fields.choices import SelectField
+from wtforms.fields.choices import SelectMultipleField
+from wtforms.form import Form
 from wtforms.widgets.core import CheckboxInput
 from wtforms.widgets.core import ColorInput
 from wtforms.widgets.core import FileInput
@@ -45,6 +51,23 @@ def test_quoting():
     assert html_params(foo='hi&bye"quot') == 'foo="hi&amp;bye&#34;quot"'
 
 
+def test_escaped_keys():
+    assert html_params(**{"a<b": "c", 'q"': True}) == 'a&lt;b="c" q&#34;'
+    assert isinstance(html_params(foo="bar"), Markup)
+
+
+def test_key_cache_bounded(monkeypatch):
+    from wtforms.widgets import core
+
+    monkeypatch.setattr(core, "_html_keys", {})
+    monkeypatch.setattr(core, "_clean_keys", {})
+    monkeypatch.setattr(core, "_KEY_CACHE_SIZE", 2)
+    for i in range(5):
+        assert html_params(**{f"data_k_{i}": i}) == f'data-k-{i}="{i}"'
+    assert len(core._html_keys) == 2
+    assert len(core._clean_keys) == 2
+
+
 def test_quoting_markup_value():
     """Double quotes in a Markup value must still be escaped in the attribute."""
     assert (
@@ -87,6 +110,25 @@ def test_tablewidget(dummy_field_class):
     )
 
 
+def test_list_and_table_render_iter(dummy_field_class):
+    inner_fields = [
+        dummy_field_class(data="hidden1", field_type="HiddenField"),
+        dummy_field_class(data="foo", label="lfoo"),
+        dummy_field_class(data="hidden2", field_type="HiddenField"),
+    ]
+    field = dummy_field_class(inner_fields, id="hai")
+    for widget in (
+        ListWidget(),
+        ListWidget(html_tag="ol", prefix_label=False),
+        TableWidget(),
+        TableWidget(with_table_tag=False),
+    ):
+        chunks = list(widget.render_iter(field, class_="c"))
+        assert len(chunks) > 3
+        assert all(isinstance(chunk, Markup) for chunk in chunks)
+        assert "".join(chunks) == widget(field, class_="c")
+
+
 def test_input_type():
     with pytest.raises(AttributeError):
         Input().input_type  # noqa: B018
@@ -184,6 +226,50 @@ def test_color_input(basic_widget_dummy_field):
     assert 'value="#ff0000"' in ColorInput()(basic_widget_dummy_field)
 
 
+def test_input_reuses_static_attributes(basic_widget_dummy_field):
+    widget = TextInput()
+    field = basic_widget_dummy_field
+    kwargs = {"class_": "c", "required": True, "z": 1}
+    for value in ("foo", 'a"<b', "", Markup("<i>")):
+        field.data = value
+        expected = html_params(name="bar", id="id", type="text", value=value, **kwargs)
+        assert widget(field, **kwargs) == f"<input {expected}>"
+    assert len(widget._fragments) == 1
+
+    assert widget(field, value=False) == '<input id="id" name="bar" type="text">'
+    kwargs["z"] = True
+    field.data = "x"
+    assert widget(field, **kwargs).endswith(' type="text" value="x" z>')
+
+
+def test_input_attributes_not_cached(basic_widget_dummy_field):
+    class ListParams(TextInput):
+        @staticmethod
+        def html_params(**kwargs):
+            return html_params(**{k: v for k, v in kwargs.items() if k != "value"})
+
+    assert (
+        ListParams()(basic_widget_dummy_field)
+        == '<input id="id" name="bar" type="text">'
+    )
+    widget = TextInput()
+    assert 'data-v="[1]"' in widget(basic_widget_dummy_field, data_v=[1])
+    assert not getattr(widget, "_fragments", None)
+    with pytest.raises(TypeError):
+        widget(basic_widget_dummy_field, name="other")
+
+
+def test_fragment_cache_bounded(basic_widget_dummy_field, monkeypatch):
+    from wtforms.widgets import core
+
+    monkeypatch.setattr(core, "_FRAGMENT_CACHE_SIZE", 2)
+    widget = TextArea()
+    for i in range(5):
+        basic_widget_dummy_field.name = f"f-{i}"
+        assert f'name="f-{i}"' in widget(basic_widget_dummy_field)
+    assert len(widget._fragments) <= 2
+
+
 def test_select(select_dummy_field):
     select_dummy_field.name = "f"
 
@@ -313,6 +399,21 @@ def test_render_option():
     )
 
 
+def test_select_staticmethod_render_option():
+    class W(Select):
+        @staticmethod
+        def render_option(choice, **kwargs):
+            return Markup(f"<option>{choice.value}</option>")
+
+    class F(Form):
+        a = SelectField(choices=["x", "y"], widget=W())
+
+    field = F().a
+    expected = '<select id="a" name="a"><option>x</option><option>y</option></select>'
+    assert field() == expected
+    assert "".join(field.render_iter()) == expected
+
+
 def test_number(html5_dummy_field):
     i1 = NumberInput(step="any")
     assert (
@@ -379,3 +480,74 @@ def test_range(html5_dummy_field):
         i4(html5_dummy_field, max=50)
         == '<input id="id" max="50" name="bar" type="range" value="42">'
     )
+
+
+class UncachedSelect(Select):
+    @classmethod
+    def render_option(cls, choice, **kwargs):
+        return super().render_option(choice, **kwargs)
+
+
+CACHED_CHOICES = [
+    SelectChoice("a", "<A>"),
+    SelectChoice("b", "", render_kw={"class_": "x", "selected": True}),
+    SelectChoice("c", "C", optgroup="g1"),
+    SelectChoice("d", "D", optgroup="g1"),
+    SelectChoice("e", "E"),
+    SelectChoice("f", "F", optgroup="g2"),
+]
+
+
+@pytest.mark.parametrize("grouped", [True, False])
+@pytest.mark.parametrize("catalog", [True, False])
+def test_select_cached_options_match_render_option(grouped, catalog):
+    choices = CACHED_CHOICES if grouped else CACHED_CHOICES[:2]
+    if catalog:
+        choices = ChoiceCatalog(choices)
+
+    class F(Form):
+        single = SelectField(choices=choices)
+        multiple = SelectMultipleField(choices=choices)
+
+    form = F(DummyPostData(single=["a"], multiple=["a", "b"]))
+    for field in (form.single, form.multiple):
+        for data in (field.data, None):
+            field.data = data
+            assert field() == UncachedSelect(field.widget.multiple)(field)
+    assert form.single._choice_index().option_html is not None
+
+
+def test_select_cached_options_follow_data():
+    class F(Form):
+        a = SelectField(choices=["x", "y"])
+
+    form = F(a="x")
+    assert '<option selected value="x">' in form.a()
+    form.a.data = "y"
+    assert '<option value="x">' in form.a()
+    assert '<option selected value="y">' in form.a()
+
+
+def test_select_overridden_iter_choices_not_cached():
+    class Reversed(SelectField):
+        def iter_choices(self):
+            return super().iter_choices()[::-1]
+
+    class F(Form):
+        a = Reversed(choices=["x", "y"])
+
+    html = F().a()
+    assert html.index('value="y"') < html.index('value="x"')
+
+
+@pytest.mark.parametrize("choices", [["a", "b"], CACHED_CHOICES])
+def test_select_render_iter(choices):
+    class F(Form):
+        s = SelectField(choices=choices, default="b")
+        u = SelectField(choices=choices, widget=UncachedSelect())
+
+    form = F()
+    for field in (form.s, form.u):
+        chunks = list(field.render_iter())
+        assert len(chunks) > 3
+        assert "".join(chunks) == field()
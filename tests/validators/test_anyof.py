@@ -54,3 +54,56 @@ def test_none_multiple_values(dummy_form, dummy_field):
     validator = AnyOf(["a", "b", "c"])
     with pytest.raises(ValueError):
         validator(dummy_form, dummy_field)
+
+
+@pytest.mark.parametrize(
+    "values, data, valid",
+    [
+        ([[1], [2]], [1], False),
+        ([[1], [2]], 2, False),
+        ([1, 2], [[1], 3], False),
+        ([1, 2], [[1], 2], True),
+        ((1.0, 2), 1, True),
+        ("abc", "bc", True),
+        ("abc", "d", False),
+    ],
+)
+def test_anyof_unindexed_values(values, data, valid, dummy_form, dummy_field):
+    """Unhashable values and data, and non-list sequences, use ``in``."""
+    validator = AnyOf(values)
+    dummy_field.data = data
+    if valid:
+        validator(dummy_form, dummy_field)
+    else:
+        with pytest.raises(ValidationError):
+            validator(dummy_form, dummy_field)
+
+
+def test_anyof_values_reassigned(dummy_form, dummy_field):
+    validator = AnyOf(["a", "b"])
+    validator.values = ["c"]
+    dummy_field.data = "c"
+    validator(dummy_form, dummy_field)
+    dummy_field.data = "a"
+    with pytest.raises(ValidationError) as e:
+        validator(dummy_form, dummy_field)
+    assert str(e.value) == "Invalid value, must be one of: c."
+
+
+def test_anyof_values_formatted_once(dummy_form, dummy_field):
+    calls = []
+
+    def formatter(values):
+        calls.append(values)
+        return "/".join(values)
+
+    validator = AnyOf(["a", "b"], values_formatter=formatter)
+    dummy_field.data = "a"
+    validator(dummy_form, dummy_field)
+    assert calls == []
+
+    dummy_field.data = "c"
+    for _ in range(2):
+        with pytest.raises(ValidationError, match="a/b"):
+            validator(dummy_form, dummy_field)
+    assert len(calls) == 1
@@ -1,6 +1,7 @@
 import email_validator
 import pytest
 
+from wtforms import validators
 from wtforms.validators import email
 from wtforms.validators import ValidationError
 
@@ -105,3 +106,44 @@ def test_explicit_test_environment_false_overrides_global(
     dummy_field.data = "user@example.test"
     with pytest.raises(ValidationError):
         validator(dummy_form, dummy_field)
+
+
+@pytest.mark.parametrize(
+    "email_address",
+    ["", "foo", "foo@", "fo o@bar.co", "foo.@bar.co", "foo@.bar.co", "foo@b_r.co"],
+)
+def test_prefilter_rejects_without_email_validator(
+    email_address, dummy_form, dummy_field, monkeypatch
+):
+    def unavailable():
+        raise AssertionError("email_validator should not be called")
+
+    monkeypatch.setattr(validators, "_email_validator", unavailable)
+    dummy_field.data = email_address
+    with pytest.raises(ValidationError) as e:
+        email()(dummy_form, dummy_field)
+
+    assert str(e.value) == "Invalid email address."
+
+
+@pytest.mark.parametrize(
+    "email_address",
+    [
+        "foo+bar@example.com",
+        '"fo o"@example.com',
+        "üser@example.com",
+        "foo@[127.0.0.1]",
+        "@example.com",
+        "foo@xn--bcher-kva.example",
+    ],
+)
+def test_prefilter_lets_plausible_addresses_through(email_address):
+    assert email._is_plausible(email_address)
+
+
+def test_prefilter_skipped_for_granular_message(dummy_form, dummy_field):
+    dummy_field.data = "foo"
+    with pytest.raises(ValidationError) as e:
+        email(granular_message=True)(dummy_form, dummy_field)
+
+    assert str(e.value) == "An email address must have an @-sign."
@@ -35,3 +35,14 @@ def test_none_of_multiple_values(dummy_form, dummy_field):
     validator = NoneOf(["a", "b", "c"])
     with pytest.raises(ValueError):
         validator(dummy_form, dummy_field)
+
+
+def test_none_of_unhashable_data(dummy_form, dummy_field):
+    validator = NoneOf(["a", {"b": 1}])
+    dummy_field.data = {"b": 1}
+    with pytest.raises(ValueError):
+        validator(dummy_form, dummy_field)
+
+    validator = NoneOf(["a", "b"])
+    dummy_field.data = {"a": 1}
+    validator(dummy_form, dummy_field)
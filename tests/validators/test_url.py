@@ -1,5 +1,8 @@
+import re
+
 import pytest
 
+from wtforms.validators import HostnameValidation
 from wtforms.validators import url
 from wtforms.validators import ValidationError
 
@@ -94,6 +97,14 @@ def test_userinfo_passes_with_allow_userinfo(url_val, dummy_form, dummy_field):
     validator(dummy_form, dummy_field)
 
 
+@pytest.mark.parametrize("url_val", ["http://@foobar.dk", "http://:@foobar.dk"])
+def test_empty_userinfo_passes(url_val, dummy_form, dummy_field):
+    """An empty ``user:password@`` carries no credentials and is accepted."""
+    validator = url()
+    dummy_field.data = url_val
+    validator(dummy_form, dummy_field)
+
+
 @pytest.mark.parametrize(
     "url_val",
     [
@@ -141,3 +152,38 @@ def test_invalid_port_raises(url_val, dummy_form, dummy_field):
     dummy_field.data = url_val
     with pytest.raises(ValidationError):
         validator(dummy_form, dummy_field)
+
+
+@pytest.mark.parametrize(
+    "hostname, require_tld, allow_ip, valid",
+    [
+        ("foobar.dk", True, False, True),
+        ("foobar.dk\n", True, False, False),
+        ("localhost\n", False, False, False),
+        ("a" * 63 + ".dk", True, False, True),
+        ("a" * 64 + ".dk", True, False, False),
+        ("xn--" + "a" * 60 + ".dk", True, False, False),
+        ("foobar.xn--p1ai", True, False, True),
+        ("foobar." + "xn--" + "a" * 60, True, False, False),
+        ("foo..dk", True, False, False),
+        ("xn-.dk", True, False, True),
+        ("bücher.dk", True, False, True),
+        ("::1", True, True, True),
+        ("::1", True, False, False),
+        ("192.168.0.1", False, True, True),
+    ],
+)
+def test_hostname_validation(hostname, require_tld, allow_ip, valid):
+    validate_hostname = HostnameValidation(require_tld=require_tld, allow_ip=allow_ip)
+    assert validate_hostname(hostname) is valid
+
+
+def test_hostname_validation_subclass_parts():
+    """Subclasses overriding the label patterns are still honored."""
+
+    class NoUnderscore(HostnameValidation):
+        hostname_part = re.compile(r"^[a-z0-9-]+$", re.IGNORECASE)
+
+    assert HostnameValidation()("foo_bar.dk")
+    assert not NoUnderscore()("foo_bar.dk")
+    assert NoUnderscore()("foo-bar.dk")
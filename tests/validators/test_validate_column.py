@@ -0,0 +1,99 @@
+import pytest
+
+from wtforms import validators
+from wtforms.validators import any_of
+from wtforms.validators import data_required
+from wtforms.validators import input_required
+from wtforms.validators import length
+from wtforms.validators import mac_address
+from wtforms.validators import none_of
+from wtforms.validators import number_range
+from wtforms.validators import regexp
+from wtforms.validators import validate_column
+from wtforms.validators import ValidationError
+
+
+@pytest.fixture(params=["numpy", "python"])
+def numpy_mode(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(validators, "_numpy", lambda: None)
+    return request.param
+
+
+def per_value(validator, form, field, values):
+    results = []
+    for value in values:
+        field.data = value
+        field.errors = []
+        try:
+            validator(form, field)
+        except ValidationError as e:
+            results.append(e.args[0])
+        except validators.StopValidation as e:
+            results.append(e.args[0])
+        else:
+            results.append(None)
+    return results
+
+
+@pytest.mark.parametrize(
+    "validator, values",
+    [
+        (length(2, 4), ["a", "ab", "abcd", "abcde", "", None]),
+        (length(-1, 3), ["abcd", "abc"]),
+        (number_range(0, 10), [-1, 0, 5.5, 10, 11, float("nan"), None]),
+        (number_range(min=2), [1, 2, 3]),
+        (any_of(["a", "b"]), ["a", "c", ["c", "b"], ["c"]]),
+        (none_of(["a", "b"]), ["a", "c", ["c", "b"], ["c"]]),
+        (regexp("^a"), ["abc", "bac", None]),
+        (data_required(), ["a", " ", "", None, 0, 1]),
+    ],
+)
+def test_validate_column_matches_call(
+    validator, values, dummy_form, dummy_field, numpy_mode
+):
+    expected = per_value(validator, dummy_form, dummy_field, values)
+    assert validate_column(validator, dummy_form, dummy_field, values) == expected
+
+
+def test_number_range_numpy_array(dummy_form, dummy_field):
+    np = pytest.importorskip("numpy")
+    values = np.array([1.0, np.nan, 5.0, 12.0])
+    assert validate_column(number_range(0, 10), dummy_form, dummy_field, values) == [
+        None,
+        "Number must be between 0 and 10.",
+        None,
+        "Number must be between 0 and 10.",
+    ]
+
+
+def test_input_required_column(dummy_form, dummy_field):
+    results = validate_column(
+        input_required(), dummy_form, dummy_field, [["a"], [""], [], None]
+    )
+    assert results == [None] + ["This field is required."] * 3
+
+
+def test_validate_column_fallback(dummy_form, dummy_field):
+    def odd(form, field):
+        if field.data % 2 == 0:
+            raise ValidationError("even")
+
+    dummy_field.data = "kept"
+    assert validate_column(odd, dummy_form, dummy_field, [1, 2, 3]) == [
+        None,
+        "even",
+        None,
+    ]
+    assert dummy_field.data == "kept"
+    assert dummy_field.errors == []
+
+
+def test_validate_column_subclass_overriding_call(dummy_form, dummy_field):
+    values = ["00:00:00:00:00:00", "nope"]
+    assert validate_column(mac_address(), dummy_form, dummy_field, values) == [
+        None,
+        "Invalid Mac address.",
+    ]
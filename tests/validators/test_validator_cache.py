@@ -0,0 +1,108 @@
+import threading
+
+import pytest
+
+from wtforms.fields import StringField
+from wtforms.form import Form
+from wtforms.validators import email
+from wtforms.validators import HostnameValidation
+from wtforms.validators import ip_address
+from wtforms.validators import url
+from wtforms.validators import ValidationError
+from wtforms.validators import ValidatorCache
+
+
+def test_hits_misses_and_eviction():
+    cache = ValidatorCache(maxsize=2)
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return value * 2
+
+    assert cache.get("a", compute, 1) == 2
+    assert cache.get("a", compute, 1) == 2
+    assert cache.get("b", compute, 2) == 4
+    assert cache.get("a", compute, 1) == 2
+    assert cache.get("c", compute, 3) == 6
+    assert cache.get("b", compute, 2) == 4
+    assert calls == [1, 2, 3, 2]
+    assert (cache.hits, cache.misses, len(cache)) == (2, 4, 2)
+
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+@pytest.mark.parametrize(
+    "validator, valid, invalid",
+    [
+        (lambda cache: email(cache=cache), "foo@example.com", "foo@example"),
+        (lambda cache: url(cache=cache), "https://example.com", "example.com"),
+        (lambda cache: ip_address(cache=cache), "127.0.0.1", "::1"),
+    ],
+)
+def test_cached_results(validator, valid, invalid, dummy_form, dummy_field):
+    cache = ValidatorCache()
+    validator = validator(cache)
+    for _ in range(3):
+        dummy_field.data = valid
+        validator(dummy_form, dummy_field)
+        dummy_field.data = invalid
+        with pytest.raises(ValidationError):
+            validator(dummy_form, dummy_field)
+    assert (cache.hits, cache.misses) == (4, 2)
+
+
+def test_cache_key_includes_configuration(dummy_form, dummy_field):
+    cache = ValidatorCache()
+    dummy_field.data = "::1"
+    ip_address(ipv6=True, cache=cache)(dummy_form, dummy_field)
+    with pytest.raises(ValidationError):
+        ip_address(cache=cache)(dummy_form, dummy_field)
+    assert cache.misses == 2
+
+    hostname = HostnameValidation(require_tld=False, cache=cache)
+    assert hostname("localhost")
+    assert not HostnameValidation(cache=cache)("localhost")
+    assert cache.misses == 4
+
+
+def test_unhashable_and_impure_values_bypass_cache(dummy_form, dummy_field):
+    cache = ValidatorCache()
+    dummy_field.data = ["not", "hashable"]
+    with pytest.raises(ValidationError):
+        ip_address(cache=cache)(dummy_form, dummy_field)
+
+    validator = email(check_deliverability=True, cache=cache)
+    assert not validator.pure
+    assert len(cache) == 0
+
+
+def test_cached_error_is_translated():
+    cache = ValidatorCache()
+
+    class F(Form):
+        a = StringField(validators=[email(cache=cache)])
+
+    form = F(a="foo@example", meta={"locales": ["fr"]})
+    form.validate()
+    form = F(a="foo@example", meta={"locales": ["de"]})
+    form.validate()
+    assert cache.hits == 1
+    assert form.a.errors == ["Ungültige E-Mail-Adresse."]
+
+
+def test_thread_safety():
+    cache = ValidatorCache(maxsize=8)
+
+    def work():
+        for i in range(500):
+            cache.get(i % 16, str, i)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cache.hits + cache.misses == 2000
+    assert len(cache) == 8